@@ -1,9 +1,29 @@
 import random
-import math
+import bisect
+import itertools
 import numpy as np
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict
 from enum import Enum
-from game_core import GameOfLife, CellType, Cell
+from game_core import GameOfLife, CellType
+
+_WAVE_COS = np.cos(np.radians(np.arange(0, 360, 10)))
+_WAVE_SIN = np.sin(np.radians(np.arange(0, 360, 10)))
+
+def _burst_velocities(count: int, min_speed: float,
+                      max_speed: float) -> Tuple[np.ndarray, np.ndarray]:
+    angle = np.random.uniform(0, 2 * np.pi, count)
+    speed = np.random.uniform(min_speed, max_speed, count)
+    return np.cos(angle) * speed, np.sin(angle) * speed
+
+@lru_cache(maxsize=None)
+def disk_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (dy, dx, distance) arrays for every cell inside a disk of the given
+    # radius, computed once per radius and reused by all events
+    dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    distance = np.hypot(dy, dx)
+    inside = distance <= radius
+    return dy[inside], dx[inside], distance[inside]
 
 class EventType(Enum):
     METEOR = "meteor"
@@ -25,7 +45,15 @@ class Event:
         self.duration = duration
         self.max_duration = duration
         self.intensity = intensity
-        self.particles = []
+
+        # Structure-of-arrays particle storage
+        self.px = np.empty(0, dtype=np.float32)
+        self.py = np.empty(0, dtype=np.float32)
+        self.pvx = np.empty(0, dtype=np.float32)
+        self.pvy = np.empty(0, dtype=np.float32)
+        self.plife = np.empty(0, dtype=np.int32)
+        self.pmax_life = np.empty(0, dtype=np.int32)
+        self.pcolor = np.empty((0, 3), dtype=np.uint8)
 
     def update(self) -> bool:
         self.duration -= 1
@@ -33,22 +61,40 @@ class Event:
         return self.duration > 0
 
     def update_particles(self):
-        for particle in self.particles[:]:
-            particle['life'] -= 1
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vx'] *= 0.95
-            particle['vy'] *= 0.95
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-
-    def add_particle(self, x: float, y: float, vx: float, vy: float, 
-                    color: Tuple[int, int, int], life: int):
-        self.particles.append({
-            'x': x, 'y': y, 'vx': vx, 'vy': vy,
-            'color': color, 'life': life, 'max_life': life
-        })
+        if self.plife.size == 0:
+            return
+
+        self.plife -= 1
+        self.px += self.pvx
+        self.py += self.pvy
+        self.pvx *= 0.95
+        self.pvy *= 0.95
+
+        alive = self.plife > 0
+        if not alive.all():
+            self.px = self.px[alive]
+            self.py = self.py[alive]
+            self.pvx = self.pvx[alive]
+            self.pvy = self.pvy[alive]
+            self.plife = self.plife[alive]
+            self.pmax_life = self.pmax_life[alive]
+            self.pcolor = self.pcolor[alive]
+
+    def add_particles(self, x: float, y: float, vx: np.ndarray, vy: np.ndarray,
+                      color: Tuple[int, int, int], life: int):
+        count = len(vx)
+        self.px = np.concatenate([self.px, np.full(count, x, dtype=np.float32)])
+        self.py = np.concatenate([self.py, np.full(count, y, dtype=np.float32)])
+        self.pvx = np.concatenate([self.pvx, np.asarray(vx, dtype=np.float32)])
+        self.pvy = np.concatenate([self.pvy, np.asarray(vy, dtype=np.float32)])
+        self.plife = np.concatenate([self.plife, np.full(count, life, dtype=np.int32)])
+        self.pmax_life = np.concatenate([self.pmax_life, np.full(count, life, dtype=np.int32)])
+        self.pcolor = np.concatenate([self.pcolor, np.tile(np.array(color, dtype=np.uint8),
+                                                           (count, 1))])
+
+    @property
+    def particle_count(self) -> int:
+        return int(self.plife.size)
 
     def get_age_factor(self) -> float:
         return 1.0 - (self.duration / self.max_duration)
@@ -72,10 +118,22 @@ class EventSystem:
             EventType.ECOSYSTEM_BLOOM: 7
         }
 
+        self._event_types = list(self.event_weights)
+        self._cum_weights = list(itertools.accumulate(self.event_weights.values()))
+
     def update(self):
-        for event in self.active_events[:]:
-            if not event.update():
-                self.active_events.remove(event)
+        if self.active_events:
+            remaining = []
+            for event in self.active_events:
+                if event.update():
+                    remaining.append(event)
+                elif event.event_type == EventType.TEMPORAL_RIFT:
+                    # durations tick at frame rate but grid effects run at
+                    # sim rate, so the write-back fires here on expiry;
+                    # a sampled window could miss entirely (or never run
+                    # while paused) and silently drop the snapshot
+                    self._restore_rift(event)
+            self.active_events = remaining
 
         self.last_event_time += 1
         if (self.last_event_time >= self.min_event_interval and 
@@ -84,10 +142,10 @@ class EventSystem:
             self.last_event_time = 0
 
     def spawn_random_event(self):
-        event_types = list(self.event_weights.keys())
-        weights = list(self.event_weights.values())
-        event_type = random.choices(event_types, weights=weights)[0]
-        
+        index = bisect.bisect(self._cum_weights,
+                              random.random() * self._cum_weights[-1])
+        event_type = self._event_types[index]
+
         x = random.randint(0, self.game.width - 1)
         y = random.randint(0, self.game.height - 1)
         
@@ -115,35 +173,29 @@ class EventSystem:
         radius = random.randint(3, 8)
         event = Event(EventType.METEOR, x, y, radius, 60, 2.0)
         
-        for _ in range(50):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            event.add_particle(x * 8, y * 8, vx, vy, (255, 100, 0), 30)
-        
+        vx, vy = _burst_velocities(50, 1, 5)
+        event.add_particles(x * 8, y * 8, vx, vy, (255, 100, 0), 30)
+
         self.active_events.append(event)
         
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                distance = math.sqrt(dx*dx + dy*dy)
-                if distance <= radius:
-                    target_x = (x + dx) % self.game.width
-                    target_y = (y + dy) % self.game.height
-                    
-                    destruction_chance = 1.0 - (distance / radius) ** 2
-                    if random.random() < destruction_chance:
-                        self.game.set_cell(target_x, target_y, CellType.EMPTY)
+        dy, dx, distance = disk_offsets(radius)
+        destruction_chance = 1.0 - (distance / radius) ** 2
+        hit = np.random.random(distance.size) < destruction_chance
+        target_y = (y + dy[hit]) % self.game.height
+        target_x = (x + dx[hit]) % self.game.width
+        self.game.cell_type[target_y, target_x] = CellType.EMPTY.value
+        self.game.energy[target_y, target_x] = 0.0
+        self.game.age[target_y, target_x] = 0
+        self.game.mutation_rate[target_y, target_x] = 0.01
+        self.game.quantum_phase[target_y, target_x] = 0.0
+        self.game.mark_grid_dirty()
 
     def spawn_energy_wave(self, x: int, y: int):
         radius = random.randint(8, 15)
         event = Event(EventType.ENERGY_WAVE, x, y, radius, 120, 1.5)
         
-        for angle in range(0, 360, 10):
-            rad = math.radians(angle)
-            vx = math.cos(rad) * 2
-            vy = math.sin(rad) * 2
-            event.add_particle(x * 8, y * 8, vx, vy, (0, 255, 255), 40)
+        event.add_particles(x * 8, y * 8, _WAVE_COS * 2, _WAVE_SIN * 2,
+                            (0, 255, 255), 40)
         
         self.active_events.append(event)
 
@@ -151,12 +203,8 @@ class EventSystem:
         radius = random.randint(4, 10)
         event = Event(EventType.MUTATION_BURST, x, y, radius, 90, 3.0)
         
-        for _ in range(30):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.5, 2)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            event.add_particle(x * 8, y * 8, vx, vy, (255, 255, 0), 25)
+        vx, vy = _burst_velocities(30, 0.5, 2)
+        event.add_particles(x * 8, y * 8, vx, vy, (255, 255, 0), 25)
         
         self.active_events.append(event)
 
@@ -164,12 +212,8 @@ class EventSystem:
         radius = random.randint(6, 12)
         event = Event(EventType.QUANTUM_STORM, x, y, radius, 150, 2.5)
         
-        for _ in range(40):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            event.add_particle(x * 8, y * 8, vx, vy, (255, 255, 255), 35)
+        vx, vy = _burst_velocities(40, 1, 3)
+        event.add_particles(x * 8, y * 8, vx, vy, (255, 255, 255), 35)
         
         self.active_events.append(event)
 
@@ -197,45 +241,52 @@ class EventSystem:
         radius = random.randint(3, 6)
         event = Event(EventType.TEMPORAL_RIFT, x, y, radius, 180, 4.0)
         
-        stored_cells = {}
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                if dx*dx + dy*dy <= radius*radius:
-                    target_x = (x + dx) % self.game.width
-                    target_y = (y + dy) % self.game.height
-                    cell = self.game.get_cell(target_x, target_y)
-                    stored_cells[(target_x, target_y)] = Cell(
-                        cell_type=cell.cell_type,
-                        energy=cell.energy,
-                        age=cell.age,
-                        mutation_rate=cell.mutation_rate,
-                        quantum_phase=cell.quantum_phase
-                    )
-        
-        event.stored_cells = stored_cells
+        dy, dx, _ = disk_offsets(radius)
+        target_y = (y + dy) % self.game.height
+        target_x = (x + dx) % self.game.width
+        event.stored_cells = (
+            target_y, target_x,
+            self.game.cell_type[target_y, target_x].copy(),
+            self.game.energy[target_y, target_x].copy(),
+            self.game.age[target_y, target_x].copy(),
+            self.game.mutation_rate[target_y, target_x].copy(),
+            self.game.quantum_phase[target_y, target_x].copy())
         self.active_events.append(event)
 
     def spawn_ecosystem_bloom(self, x: int, y: int):
         radius = random.randint(6, 15)
         event = Event(EventType.ECOSYSTEM_BLOOM, x, y, radius, 100, 2.0)
         
-        species_list = [CellType.RED, CellType.GREEN, CellType.BLUE, CellType.QUANTUM]
-        
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                distance = math.sqrt(dx*dx + dy*dy)
-                if distance <= radius and random.random() < 0.4:
-                    target_x = (x + dx) % self.game.width
-                    target_y = (y + dy) % self.game.height
-                    
-                    species = random.choice(species_list)
-                    bloom_chance = 1.0 - (distance / radius)
-                    if random.random() < bloom_chance:
-                        self.game.set_cell(target_x, target_y, species, energy=1.5)
-        
+        dy, dx, distance = disk_offsets(radius)
+        bloom_chance = 1.0 - (distance / radius)
+        hit = ((np.random.random(distance.size) < 0.4) &
+               (np.random.random(distance.size) < bloom_chance))
+        target_y = (y + dy[hit]) % self.game.height
+        target_x = (x + dx[hit]) % self.game.width
+        species = np.random.randint(1, 5, size=int(hit.sum()), dtype=np.uint8)
+        self._set_cells(target_y, target_x, species, 1.5)
+
         self.active_events.append(event)
 
+    def _set_cells(self, target_y: np.ndarray, target_x: np.ndarray,
+                   species, energy):
+        # Batched equivalent of game.set_cell for fancy-indexed targets
+        count = len(target_y)
+        species = np.broadcast_to(np.asarray(species, dtype=np.uint8), (count,))
+        energy = np.broadcast_to(np.asarray(energy, dtype=np.float32), (count,))
+
+        self.game.cell_type[target_y, target_x] = species
+        self.game.energy[target_y, target_x] = energy
+        self.game.age[target_y, target_x] = 0
+        self.game.mutation_rate[target_y, target_x] = 0.01
+        self.game.quantum_phase[target_y, target_x] = np.where(
+            species == CellType.QUANTUM.value,
+            np.random.random(count) * 2 * np.pi, 0.0)
+        self.game.mark_grid_dirty()
+
     def apply_event_effects(self):
+        if not self.active_events:
+            return
         for event in self.active_events:
             self.apply_event_to_cells(event)
 
@@ -244,77 +295,88 @@ class EventSystem:
         
         if event.event_type == EventType.ENERGY_WAVE:
             wave_radius = event.radius * age_factor
-            for dy in range(-event.radius, event.radius + 1):
-                for dx in range(-event.radius, event.radius + 1):
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if abs(distance - wave_radius) < 2:
-                        target_x = (event.x + dx) % self.game.width
-                        target_y = (event.y + dy) % self.game.height
-                        cell = self.game.get_cell(target_x, target_y)
-                        
-                        if cell.cell_type != CellType.EMPTY:
-                            new_energy = min(3.0, cell.energy + event.intensity * 0.5)
-                            self.game.set_cell(target_x, target_y, cell.cell_type, new_energy)
+            # the original scan covered the [-radius, radius] square, whose
+            # corners sit further out than the disk; widen the disk and
+            # mask back to the square so the wave's outer edge keeps full
+            # coverage late in its life
+            dy, dx, distance = disk_offsets(event.radius + 2)
+            square = (np.abs(dy) <= event.radius) & (np.abs(dx) <= event.radius)
+            annulus = square & (np.abs(distance - wave_radius) < 2)
+            target_y = (event.y + dy[annulus]) % self.game.height
+            target_x = (event.x + dx[annulus]) % self.game.width
+
+            cell_types = self.game.cell_type[target_y, target_x]
+            hit = cell_types != CellType.EMPTY.value
+            target_y, target_x = target_y[hit], target_x[hit]
+            self._set_cells(target_y, target_x, cell_types[hit],
+                            np.minimum(3.0, self.game.energy[target_y, target_x] +
+                                       event.intensity * 0.5))
 
         elif event.event_type == EventType.MUTATION_BURST:
-            for dy in range(-event.radius, event.radius + 1):
-                for dx in range(-event.radius, event.radius + 1):
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance <= event.radius:
-                        target_x = (event.x + dx) % self.game.width
-                        target_y = (event.y + dy) % self.game.height
-                        cell = self.game.get_cell(target_x, target_y)
-                        
-                        if cell.cell_type != CellType.EMPTY:
-                            mutation_boost = event.intensity * (1.0 - distance / event.radius) * 0.05
-                            if random.random() < mutation_boost:
-                                new_species = random.choice([CellType.RED, CellType.GREEN, 
-                                                           CellType.BLUE, CellType.QUANTUM])
-                                self.game.set_cell(target_x, target_y, new_species, cell.energy)
+            dy, dx, distance = disk_offsets(event.radius)
+            target_y = (event.y + dy) % self.game.height
+            target_x = (event.x + dx) % self.game.width
+
+            mutation_boost = event.intensity * (1.0 - distance / event.radius) * 0.05
+            hit = ((self.game.cell_type[target_y, target_x] != CellType.EMPTY.value) &
+                   (np.random.random(distance.size) < mutation_boost))
+            target_y, target_x = target_y[hit], target_x[hit]
+            species = np.random.randint(1, 5, size=len(target_y), dtype=np.uint8)
+            self._set_cells(target_y, target_x, species,
+                            self.game.energy[target_y, target_x])
 
         elif event.event_type == EventType.QUANTUM_STORM:
-            for dy in range(-event.radius, event.radius + 1):
-                for dx in range(-event.radius, event.radius + 1):
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance <= event.radius:
-                        target_x = (event.x + dx) % self.game.width
-                        target_y = (event.y + dy) % self.game.height
-                        cell = self.game.get_cell(target_x, target_y)
-                        
-                        quantum_chance = event.intensity * (1.0 - distance / event.radius) * 0.1
-                        if (cell.cell_type != CellType.EMPTY and 
-                            cell.cell_type != CellType.QUANTUM and 
-                            random.random() < quantum_chance):
-                            self.game.set_cell(target_x, target_y, CellType.QUANTUM, cell.energy)
+            dy, dx, distance = disk_offsets(event.radius)
+            target_y = (event.y + dy) % self.game.height
+            target_x = (event.x + dx) % self.game.width
+
+            cell_types = self.game.cell_type[target_y, target_x]
+            quantum_chance = event.intensity * (1.0 - distance / event.radius) * 0.1
+            hit = ((cell_types != CellType.EMPTY.value) &
+                   (cell_types != CellType.QUANTUM.value) &
+                   (np.random.random(distance.size) < quantum_chance))
+            target_y, target_x = target_y[hit], target_x[hit]
+            self._set_cells(target_y, target_x, CellType.QUANTUM.value,
+                            self.game.energy[target_y, target_x])
 
         elif event.event_type == EventType.COSMIC_RADIATION:
-            for dy in range(-event.radius, event.radius + 1):
-                for dx in range(-event.radius, event.radius + 1):
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    if distance <= event.radius and random.random() < 0.02:
-                        target_x = (event.x + dx) % self.game.width
-                        target_y = (event.y + dy) % self.game.height
-                        cell = self.game.get_cell(target_x, target_y)
-                        
-                        effect = random.choice(['energy_boost', 'mutation', 'death', 'birth'])
-                        
-                        if effect == 'energy_boost' and cell.cell_type != CellType.EMPTY:
-                            new_energy = min(3.0, cell.energy + 0.5)
-                            self.game.set_cell(target_x, target_y, cell.cell_type, new_energy)
-                        elif effect == 'mutation' and cell.cell_type != CellType.EMPTY:
-                            new_species = random.choice([CellType.RED, CellType.GREEN, 
-                                                       CellType.BLUE, CellType.QUANTUM])
-                            self.game.set_cell(target_x, target_y, new_species, cell.energy)
-                        elif effect == 'death':
-                            self.game.set_cell(target_x, target_y, CellType.EMPTY)
-                        elif effect == 'birth' and cell.cell_type == CellType.EMPTY:
-                            new_species = random.choice([CellType.RED, CellType.GREEN, CellType.BLUE])
-                            self.game.set_cell(target_x, target_y, new_species, 1.0)
-
-        elif event.event_type == EventType.TEMPORAL_RIFT:
-            if event.duration <= 10 and hasattr(event, 'stored_cells'):
-                for (target_x, target_y), stored_cell in event.stored_cells.items():
-                    self.game.grid[target_y, target_x] = stored_cell
+            dy, dx, _ = disk_offsets(event.radius)
+            hit = np.random.random(dy.size) < 0.02
+            target_y = (event.y + dy[hit]) % self.game.height
+            target_x = (event.x + dx[hit]) % self.game.width
+
+            cell_types = self.game.cell_type[target_y, target_x]
+            energies = self.game.energy[target_y, target_x]
+            effect = np.random.randint(0, 4, size=len(target_y))
+            nonempty = cell_types != CellType.EMPTY.value
+
+            boost = (effect == 0) & nonempty
+            self._set_cells(target_y[boost], target_x[boost], cell_types[boost],
+                            np.minimum(3.0, energies[boost] + 0.5))
+
+            mutation = (effect == 1) & nonempty
+            species = np.random.randint(1, 5, size=int(mutation.sum()), dtype=np.uint8)
+            self._set_cells(target_y[mutation], target_x[mutation], species,
+                            energies[mutation])
+
+            death = effect == 2
+            self._set_cells(target_y[death], target_x[death],
+                            CellType.EMPTY.value, 0.0)
+
+            birth = (effect == 3) & ~nonempty
+            species = np.random.randint(1, 4, size=int(birth.sum()), dtype=np.uint8)
+            self._set_cells(target_y[birth], target_x[birth], species, 1.0)
+
+    def _restore_rift(self, event: Event):
+        if not hasattr(event, 'stored_cells'):
+            return
+        target_y, target_x, cell_types, energies, ages, rates, phases = event.stored_cells
+        self.game.cell_type[target_y, target_x] = cell_types
+        self.game.energy[target_y, target_x] = energies
+        self.game.age[target_y, target_x] = ages
+        self.game.mutation_rate[target_y, target_x] = rates
+        self.game.quantum_phase[target_y, target_x] = phases
+        self.game.mark_grid_dirty()
 
     def get_event_info(self, event: Event) -> Dict:
         return {
@@ -326,7 +388,7 @@ class EventSystem:
             'max_duration': event.max_duration,
             'intensity': event.intensity,
             'age_factor': event.get_age_factor(),
-            'particles': len(event.particles)
+            'particles': event.particle_count
         }
 
     def clear_events(self):
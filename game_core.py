@@ -1,8 +1,14 @@
 import numpy as np
 import random
+import math
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, NamedTuple, Optional
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 class CellType(Enum):
     EMPTY = 0
@@ -11,8 +17,110 @@ class CellType(Enum):
     BLUE = 3
     QUANTUM = 4
 
-@dataclass
-class Cell:
+NEIGHBOR_OFFSETS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                    if (dy, dx) != (0, 0)]
+
+# One uint32 lane per species (8 bits each); neighbor counts max out at 8,
+# so lanes never carry into each other and one packed stencil pass counts
+# all four species at once
+_PACK_LUT = np.array([0, 1, 1 << 8, 1 << 16, 1 << 24], dtype=np.uint32)
+
+# Below this live-cell density the candidate-list update beats the dense
+# full-grid stencil
+_SPARSE_DENSITY = 0.15
+
+def _step_kernel(cell_type, energy, age, mutation_rate, quantum_phase,
+                 next_cell_type, next_energy, next_age, next_mutation_rate,
+                 next_quantum_phase, interaction_lut, wrap_y, wrap_x,
+                 rand_a, rand_b, rand_species, rand_phase):
+    # rand_a doubles as the mutation test (alive cells) and the quantum
+    # birth test (empty cells) - the two populations are disjoint
+    height, width = cell_type.shape
+
+    for y in prange(height):
+        for x in range(width):
+            red_n = green_n = blue_n = quantum_n = 0
+            for dy in range(-1, 2):
+                ny = wrap_y[y + dy + height]
+                for dx in range(-1, 2):
+                    if dx == 0 and dy == 0:
+                        continue
+                    neighbor = cell_type[ny, wrap_x[x + dx + width]]
+                    if neighbor == 1:
+                        red_n += 1
+                    elif neighbor == 2:
+                        green_n += 1
+                    elif neighbor == 3:
+                        blue_n += 1
+                    elif neighbor == 4:
+                        quantum_n += 1
+            alive_n = red_n + green_n + blue_n + quantum_n
+
+            current = cell_type[y, x]
+
+            # Every branch writes the full record, so the caller never has
+            # to pre-zero the next buffers
+            next_cell_type[y, x] = 0
+            next_energy[y, x] = 0.0
+            next_age[y, x] = 0
+            next_mutation_rate[y, x] = 0.01
+            next_quantum_phase[y, x] = 0.0
+
+            if current == 0:
+                if alive_n == 3:
+                    if red_n >= green_n and red_n >= blue_n:
+                        winner = 1
+                    elif green_n >= blue_n:
+                        winner = 2
+                    else:
+                        winner = 3
+                    if quantum_n > 0 and rand_a[y, x] < 0.3:
+                        winner = 4
+                    next_cell_type[y, x] = winner
+                    next_energy[y, x] = 1.0
+                    next_age[y, x] = 0
+                    next_mutation_rate[y, x] = 0.01
+                    next_quantum_phase[y, x] = 0.0
+            else:
+                bonus = (interaction_lut[current, 1] * red_n +
+                         interaction_lut[current, 2] * green_n +
+                         interaction_lut[current, 3] * blue_n +
+                         interaction_lut[current, 4] * quantum_n)
+
+                low = 2
+                high = 3
+                if current == 1:
+                    high = 4
+                elif current == 2:
+                    low = 1
+                elif current == 4:
+                    phase_factor = (math.sin(quantum_phase[y, x]) + 1) / 2
+                    low = int(1 + phase_factor)
+                    high = int(3 + phase_factor)
+
+                energy_factor = min(2.0, energy[y, x] + bonus)
+                if low <= alive_n <= high and energy_factor > 0.1:
+                    winner = current
+                    phase = quantum_phase[y, x]
+                    if rand_a[y, x] < mutation_rate[y, x] * (age[y, x] / 100):
+                        if rand_b[y, x] < 0.1:
+                            winner = 4
+                            phase = rand_phase[y, x]
+                        else:
+                            winner = 1 + int(rand_species[y, x] * 3)
+                    next_cell_type[y, x] = winner
+                    next_energy[y, x] = min(2.0, energy[y, x] + bonus - 0.1)
+                    next_age[y, x] = age[y, x] + 1
+                    next_mutation_rate[y, x] = mutation_rate[y, x]
+                    next_quantum_phase[y, x] = phase
+
+if NUMBA_AVAILABLE:
+    _step_kernel = njit(parallel=True, cache=True, fastmath=True)(_step_kernel)
+else:
+    prange = range
+
+class Cell(NamedTuple):
+    # Read-only record view over the SoA grid, handed out by get_cell()
     cell_type: CellType = CellType.EMPTY
     energy: float = 0.0
     age: int = 0
@@ -23,22 +131,39 @@ class GameOfLife:
     def __init__(self, width: int = 120, height: int = 80):
         self.width = width
         self.height = height
-        self.grid = np.zeros((height, width), dtype=object)
-        self.next_grid = np.zeros((height, width), dtype=object)
+
+        # Structure-of-arrays cell storage: one contiguous array per attribute
+        shape = (height, width)
+        self.cell_type = np.zeros(shape, dtype=np.uint8)
+        self.energy = np.zeros(shape, dtype=np.float32)
+        self.age = np.zeros(shape, dtype=np.int32)
+        self.mutation_rate = np.full(shape, 0.01, dtype=np.float32)
+        self.quantum_phase = np.zeros(shape, dtype=np.float32)
+
+        self.next_cell_type = np.zeros(shape, dtype=np.uint8)
+        self.next_energy = np.zeros(shape, dtype=np.float32)
+        self.next_age = np.zeros(shape, dtype=np.int32)
+        self.next_mutation_rate = np.full(shape, 0.01, dtype=np.float32)
+        self.next_quantum_phase = np.zeros(shape, dtype=np.float32)
+
         self.generation = 0
         self.total_energy = 0.0
-        self.population_history = {
-            CellType.RED: [],
-            CellType.GREEN: [],
-            CellType.BLUE: [],
-            CellType.QUANTUM: []
-        }
-        
-        for y in range(height):
-            for x in range(width):
-                self.grid[y, x] = Cell()
-                self.next_grid[y, x] = Cell()
-        
+        self.last_births = 0
+        self.last_deaths = 0
+
+        # Fixed-size ring buffer, one row per non-empty species
+        self.history_length = 1000
+        self.population_history = np.zeros((4, self.history_length), dtype=np.int32)
+        self.history_index = 0
+
+        # Cached per-type bincount, refreshed once per update; direct grid
+        # writes outside set_cell must call mark_grid_dirty()
+        self._population_counts = np.zeros(5, dtype=np.int64)
+        self._counts_dirty = True
+        self._alive_mask = None
+        self._counts_dict = None
+        self._counts_dict_src = None
+
         self.interaction_matrix = {
             (CellType.RED, CellType.GREEN): 0.1,
             (CellType.RED, CellType.BLUE): -0.05,
@@ -48,223 +173,366 @@ class GameOfLife:
             (CellType.BLUE, CellType.QUANTUM): 0.2,
         }
 
-    def get_neighbors(self, x: int, y: int) -> List[Cell]:
-        neighbors = []
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = (x + dx) % self.width, (y + dy) % self.height
-                neighbors.append(self.grid[ny, nx])
-        return neighbors
-
-    def count_neighbors_by_type(self, x: int, y: int) -> Dict[CellType, int]:
-        neighbors = self.get_neighbors(x, y)
-        counts = {cell_type: 0 for cell_type in CellType}
-        for neighbor in neighbors:
-            counts[neighbor.cell_type] += 1
+        # Toroidal wrap lookups covering offsets in [-dim, 2*dim)
+        self.wrap_x = np.arange(-width, 2 * width) % width
+        self.wrap_y = np.arange(-height, 2 * height) % height
+
+        # Symmetric 5x5 bonus lookup indexed by integer cell types
+        self.interaction_lut = np.zeros((5, 5), dtype=np.float32)
+        for (type_a, type_b), value in self.interaction_matrix.items():
+            self.interaction_lut[type_a.value, type_b.value] = value
+            self.interaction_lut[type_b.value, type_a.value] = value
+
+    def count_neighbors_by_type(self) -> np.ndarray:
+        # (5, H, W) stack of per-species neighbor counts over the 8-cell
+        # toroidal stencil; one packed-lane pass instead of one per species
+        packed = _PACK_LUT[self.cell_type]
+        total = np.zeros_like(packed)
+        for dy, dx in NEIGHBOR_OFFSETS:
+            total += np.roll(np.roll(packed, dy, axis=0), dx, axis=1)
+
+        counts = np.zeros((5, self.height, self.width), dtype=np.int16)
+        for species in range(1, 5):
+            counts[species] = (total >> (8 * (species - 1))) & 0xFF
         return counts
 
-    def calculate_interaction_bonus(self, cell: Cell, neighbors: List[Cell]) -> float:
-        bonus = 0.0
-        for neighbor in neighbors:
-            if neighbor.cell_type == CellType.EMPTY:
-                continue
-            
-            interaction_key = (cell.cell_type, neighbor.cell_type)
-            reverse_key = (neighbor.cell_type, cell.cell_type)
-            
-            if interaction_key in self.interaction_matrix:
-                bonus += self.interaction_matrix[interaction_key]
-            elif reverse_key in self.interaction_matrix:
-                bonus += self.interaction_matrix[reverse_key]
-        
+    def calculate_interaction_bonus(self, neighbor_counts: np.ndarray) -> np.ndarray:
+        bonus = np.zeros((self.height, self.width), dtype=np.float32)
+        for species in range(1, 5):
+            bonus += self.interaction_lut[self.cell_type, species] * neighbor_counts[species]
         return bonus
 
-    def apply_quantum_effects(self, cell: Cell, x: int, y: int) -> Cell:
-        new_cell = Cell()
-        new_cell.cell_type = cell.cell_type
-        new_cell.energy = cell.energy
-        new_cell.age = cell.age
-        new_cell.mutation_rate = cell.mutation_rate
-        
-        if cell.cell_type == CellType.QUANTUM:
-            if random.random() < 0.05:
-                tunnel_x = (x + random.randint(-2, 2)) % self.width
-                tunnel_y = (y + random.randint(-2, 2)) % self.height
-                if self.grid[tunnel_y, tunnel_x].cell_type == CellType.EMPTY:
-                    self.next_grid[tunnel_y, tunnel_x] = Cell(
-                        cell_type=CellType.QUANTUM,
-                        energy=cell.energy * 0.7,
-                        quantum_phase=random.random() * 2 * np.pi
-                    )
-            
-            new_cell.quantum_phase = (cell.quantum_phase + 0.1) % (2 * np.pi)
-        
-        return new_cell
-
-    def apply_species_rules(self, cell: Cell, neighbor_counts: Dict[CellType, int], 
-                          neighbors: List[Cell], x: int, y: int) -> Cell:
-        alive_neighbors = sum(count for cell_type, count in neighbor_counts.items() 
-                            if cell_type != CellType.EMPTY)
-        
-        new_cell = Cell()
-        
-        if cell.cell_type == CellType.EMPTY:
-            red_neighbors = neighbor_counts[CellType.RED]
-            green_neighbors = neighbor_counts[CellType.GREEN]
-            blue_neighbors = neighbor_counts[CellType.BLUE]
-            quantum_neighbors = neighbor_counts[CellType.QUANTUM]
-            
-            if alive_neighbors == 3:
-                if red_neighbors >= green_neighbors and red_neighbors >= blue_neighbors:
-                    new_cell.cell_type = CellType.RED if quantum_neighbors == 0 else (
-                        CellType.QUANTUM if random.random() < 0.3 else CellType.RED)
-                elif green_neighbors >= blue_neighbors:
-                    new_cell.cell_type = CellType.GREEN if quantum_neighbors == 0 else (
-                        CellType.QUANTUM if random.random() < 0.3 else CellType.GREEN)
-                else:
-                    new_cell.cell_type = CellType.BLUE if quantum_neighbors == 0 else (
-                        CellType.QUANTUM if random.random() < 0.3 else CellType.BLUE)
-                
-                new_cell.energy = 1.0
-                new_cell.age = 0
-        
-        else:
-            interaction_bonus = self.calculate_interaction_bonus(cell, neighbors)
-            energy_factor = min(2.0, cell.energy + interaction_bonus)
-            
-            survival_threshold_low = 2
-            survival_threshold_high = 3
-            
-            if cell.cell_type == CellType.RED:
-                survival_threshold_high = 4
-            elif cell.cell_type == CellType.GREEN:
-                survival_threshold_low = 1
-            elif cell.cell_type == CellType.BLUE:
-                pass
-            elif cell.cell_type == CellType.QUANTUM:
-                phase_factor = (np.sin(cell.quantum_phase) + 1) / 2
-                survival_threshold_low = int(1 + phase_factor)
-                survival_threshold_high = int(3 + phase_factor)
-            
-            if (survival_threshold_low <= alive_neighbors <= survival_threshold_high and 
-                energy_factor > 0.1):
-                new_cell = Cell(
-                    cell_type=cell.cell_type,
-                    energy=min(2.0, cell.energy + interaction_bonus - 0.1),
-                    age=cell.age + 1,
-                    mutation_rate=cell.mutation_rate,
-                    quantum_phase=cell.quantum_phase
-                )
-                
-                if random.random() < cell.mutation_rate * (cell.age / 100):
-                    species_list = [CellType.RED, CellType.GREEN, CellType.BLUE]
-                    if random.random() < 0.1:
-                        new_cell.cell_type = CellType.QUANTUM
-                        new_cell.quantum_phase = random.random() * 2 * np.pi
-                    else:
-                        new_cell.cell_type = random.choice(species_list)
-        
-        return new_cell
+    def apply_quantum_effects(self):
+        quantum_y, quantum_x = np.nonzero(self.next_cell_type == CellType.QUANTUM.value)
+        if quantum_y.size:
+            tunnel = np.random.random(quantum_y.size) < 0.05
+            source_y, source_x = quantum_y[tunnel], quantum_x[tunnel]
+            tunnel_y = self.wrap_y[source_y + np.random.randint(-2, 3, source_y.size) + self.height]
+            tunnel_x = self.wrap_x[source_x + np.random.randint(-2, 3, source_x.size) + self.width]
+
+            empty = self.cell_type[tunnel_y, tunnel_x] == CellType.EMPTY.value
+            tunnel_y, tunnel_x = tunnel_y[empty], tunnel_x[empty]
+            self.next_cell_type[tunnel_y, tunnel_x] = CellType.QUANTUM.value
+            self.next_energy[tunnel_y, tunnel_x] = (
+                self.next_energy[source_y[empty], source_x[empty]] * 0.7)
+            self.next_quantum_phase[tunnel_y, tunnel_x] = (
+                np.random.random(tunnel_y.size) * 2 * np.pi)
+
+            self.next_quantum_phase[quantum_y, quantum_x] = (
+                (self.next_quantum_phase[quantum_y, quantum_x] + 0.1) % (2 * np.pi))
 
     def update(self):
         self.generation += 1
-        self.total_energy = 0.0
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                self.next_grid[y, x] = Cell()
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.grid[y, x]
-                neighbor_counts = self.count_neighbors_by_type(x, y)
-                neighbors = self.get_neighbors(x, y)
-                
-                new_cell = self.apply_species_rules(cell, neighbor_counts, neighbors, x, y)
-                
-                if new_cell.cell_type != CellType.EMPTY or cell.cell_type == CellType.QUANTUM:
-                    new_cell = self.apply_quantum_effects(new_cell, x, y)
-                
-                self.next_grid[y, x] = new_cell
-                self.total_energy += new_cell.energy
-        
-        self.grid, self.next_grid = self.next_grid, self.grid
-        
+
+        live = int(self._population_bincount()[1:].sum())
+        if live < _SPARSE_DENSITY * self.width * self.height:
+            self._update_sparse()
+        elif NUMBA_AVAILABLE:
+            self._update_numba()
+        else:
+            self._update_numpy()
+
+        self.apply_quantum_effects()
+
+        self.cell_type, self.next_cell_type = self.next_cell_type, self.cell_type
+        self.energy, self.next_energy = self.next_energy, self.energy
+        self.age, self.next_age = self.next_age, self.age
+        self.mutation_rate, self.next_mutation_rate = self.next_mutation_rate, self.mutation_rate
+        self.quantum_phase, self.next_quantum_phase = self.next_quantum_phase, self.quantum_phase
+
+        # Single fused stats pass over the freshly computed grid; the old
+        # generation now sits in next_cell_type, so the alive-mask delta
+        # gives exact birth/death counts
+        old_alive = self.next_cell_type != CellType.EMPTY.value
+        new_alive = self.cell_type != CellType.EMPTY.value
+        self.last_births = int(np.count_nonzero(new_alive & ~old_alive))
+        self.last_deaths = int(np.count_nonzero(old_alive & ~new_alive))
+
+        self._population_counts = np.bincount(self.cell_type.ravel(), minlength=5)
+        self._counts_dirty = False
+        self._alive_mask = new_alive
+        self.total_energy = float(self.energy.sum())
+
         self.update_population_history()
 
+    def mark_grid_dirty(self):
+        self._counts_dirty = True
+        self._alive_mask = None
+
+    def get_alive_mask(self) -> np.ndarray:
+        # Cached (H, W) bool mask of occupied cells; callers must not
+        # write through it
+        if self._alive_mask is None:
+            self._alive_mask = self.cell_type != CellType.EMPTY.value
+        return self._alive_mask
+
+    def _population_bincount(self) -> np.ndarray:
+        if self._counts_dirty:
+            self._population_counts = np.bincount(self.cell_type.ravel(), minlength=5)
+            self._counts_dirty = False
+        return self._population_counts
+
+    def _update_numba(self):
+        shape = (self.height, self.width)
+        _step_kernel(self.cell_type, self.energy, self.age,
+                     self.mutation_rate, self.quantum_phase,
+                     self.next_cell_type, self.next_energy, self.next_age,
+                     self.next_mutation_rate, self.next_quantum_phase,
+                     self.interaction_lut, self.wrap_y, self.wrap_x,
+                     np.random.random(shape), np.random.random(shape),
+                     np.random.random(shape), np.random.random(shape) * 2 * np.pi)
+
+    def _update_numpy(self):
+        self.next_cell_type.fill(0)
+        self.next_energy.fill(0.0)
+        self.next_age.fill(0)
+        self.next_mutation_rate.fill(0.01)
+        self.next_quantum_phase.fill(0.0)
+
+        cell_type = self.cell_type
+        shape = (self.height, self.width)
+
+        neighbor_counts = self.count_neighbors_by_type()
+        red_n, green_n, blue_n, quantum_n = neighbor_counts[1:]
+        alive_n = red_n + green_n + blue_n + quantum_n
+
+        # Survival: per-species thresholds plus the energy-factor gate
+        alive = cell_type != CellType.EMPTY.value
+        bonus = self.calculate_interaction_bonus(neighbor_counts)
+        energy_factor = np.minimum(2.0, self.energy + bonus)
+
+        low = np.full(shape, 2, dtype=np.int16)
+        high = np.full(shape, 3, dtype=np.int16)
+        low[cell_type == CellType.GREEN.value] = 1
+        high[cell_type == CellType.RED.value] = 4
+        quantum = cell_type == CellType.QUANTUM.value
+        phase_factor = (np.sin(self.quantum_phase[quantum]) + 1) / 2
+        low[quantum] = (1 + phase_factor).astype(np.int16)
+        high[quantum] = (3 + phase_factor).astype(np.int16)
+
+        survive = (alive & (alive_n >= low) & (alive_n <= high) &
+                   (energy_factor > 0.1))
+
+        self.next_cell_type[survive] = cell_type[survive]
+        self.next_energy[survive] = np.minimum(
+            2.0, self.energy + bonus - 0.1)[survive]
+        self.next_age[survive] = self.age[survive] + 1
+        self.next_mutation_rate[survive] = self.mutation_rate[survive]
+        self.next_quantum_phase[survive] = self.quantum_phase[survive]
+
+        # Age-scaled mutations on the survivors
+        mutate = survive & (np.random.random(shape) <
+                            self.mutation_rate * (self.age / 100))
+        to_quantum = mutate & (np.random.random(shape) < 0.1)
+        new_species = np.random.randint(1, 4, shape, dtype=np.uint8)
+        self.next_cell_type[mutate] = new_species[mutate]
+        self.next_cell_type[to_quantum] = CellType.QUANTUM.value
+        self.next_quantum_phase[to_quantum] = (
+            np.random.random(int(to_quantum.sum())) * 2 * np.pi)
+
+        # Births: majority species wins (red beats ties, then green), with
+        # a 30% quantum conversion next to quantum neighbors
+        birth = (~alive) & (alive_n == 3)
+        # argmax keeps the red >= green >= blue tie-breaking of the old cascade
+        winner = (np.stack((red_n, green_n, blue_n)).argmax(axis=0) + 1).astype(np.uint8)
+        quantum_birth = birth & (quantum_n > 0) & (np.random.random(shape) < 0.3)
+
+        self.next_cell_type[birth] = winner[birth]
+        self.next_cell_type[quantum_birth] = CellType.QUANTUM.value
+        self.next_energy[birth] = 1.0
+
+    def _update_sparse(self):
+        self.next_cell_type.fill(0)
+        self.next_energy.fill(0.0)
+        self.next_age.fill(0)
+        self.next_mutation_rate.fill(0.01)
+        self.next_quantum_phase.fill(0.0)
+
+        live_y, live_x = np.nonzero(self.cell_type)
+        if live_y.size == 0:
+            return
+
+        # Only live cells and their toroidal neighbors can leave the
+        # default empty record, so restrict the rule pass to those
+        offs_y = np.array([dy for dy, dx in NEIGHBOR_OFFSETS] + [0])
+        offs_x = np.array([dx for dy, dx in NEIGHBOR_OFFSETS] + [0])
+        flat = np.unique(
+            self.wrap_y[live_y[:, None] + offs_y + self.height] * self.width +
+            self.wrap_x[live_x[:, None] + offs_x + self.width])
+        cy, cx = np.divmod(flat, self.width)
+        n = flat.size
+
+        packed = np.zeros(n, dtype=np.uint32)
+        for dy, dx in NEIGHBOR_OFFSETS:
+            packed += _PACK_LUT[self.cell_type[
+                self.wrap_y[cy + dy + self.height],
+                self.wrap_x[cx + dx + self.width]]]
+        red_n = (packed & 0xFF).astype(np.int16)
+        green_n = ((packed >> 8) & 0xFF).astype(np.int16)
+        blue_n = ((packed >> 16) & 0xFF).astype(np.int16)
+        quantum_n = ((packed >> 24) & 0xFF).astype(np.int16)
+        alive_n = red_n + green_n + blue_n + quantum_n
+
+        current = self.cell_type[cy, cx]
+        energy = self.energy[cy, cx]
+        age = self.age[cy, cx]
+        mutation_rate = self.mutation_rate[cy, cx]
+        quantum_phase = self.quantum_phase[cy, cx]
+
+        alive = current != CellType.EMPTY.value
+        bonus = (self.interaction_lut[current, 1] * red_n +
+                 self.interaction_lut[current, 2] * green_n +
+                 self.interaction_lut[current, 3] * blue_n +
+                 self.interaction_lut[current, 4] * quantum_n)
+        energy_factor = np.minimum(2.0, energy + bonus)
+
+        low = np.full(n, 2, dtype=np.int16)
+        high = np.full(n, 3, dtype=np.int16)
+        low[current == CellType.GREEN.value] = 1
+        high[current == CellType.RED.value] = 4
+        quantum = current == CellType.QUANTUM.value
+        phase_factor = (np.sin(quantum_phase[quantum]) + 1) / 2
+        low[quantum] = (1 + phase_factor).astype(np.int16)
+        high[quantum] = (3 + phase_factor).astype(np.int16)
+
+        survive = (alive & (alive_n >= low) & (alive_n <= high) &
+                   (energy_factor > 0.1))
+
+        sy, sx = cy[survive], cx[survive]
+        self.next_cell_type[sy, sx] = current[survive]
+        self.next_energy[sy, sx] = np.minimum(
+            2.0, energy + bonus - 0.1)[survive]
+        self.next_age[sy, sx] = age[survive] + 1
+        self.next_mutation_rate[sy, sx] = mutation_rate[survive]
+        self.next_quantum_phase[sy, sx] = quantum_phase[survive]
+
+        mutate = survive & (np.random.random(n) <
+                            mutation_rate * (age / 100))
+        to_quantum = mutate & (np.random.random(n) < 0.1)
+        new_species = np.random.randint(1, 4, n).astype(np.uint8)
+        self.next_cell_type[cy[mutate], cx[mutate]] = new_species[mutate]
+        self.next_cell_type[cy[to_quantum], cx[to_quantum]] = CellType.QUANTUM.value
+        self.next_quantum_phase[cy[to_quantum], cx[to_quantum]] = (
+            np.random.random(int(to_quantum.sum())) * 2 * np.pi)
+
+        birth = (~alive) & (alive_n == 3)
+        winner = (np.stack((red_n, green_n, blue_n)).argmax(axis=0) + 1).astype(np.uint8)
+        quantum_birth = birth & (quantum_n > 0) & (np.random.random(n) < 0.3)
+
+        by, bx = cy[birth], cx[birth]
+        self.next_cell_type[by, bx] = winner[birth]
+        self.next_cell_type[cy[quantum_birth], cx[quantum_birth]] = CellType.QUANTUM.value
+        self.next_energy[by, bx] = 1.0
+
     def update_population_history(self):
-        counts = {cell_type: 0 for cell_type in CellType if cell_type != CellType.EMPTY}
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                cell_type = self.grid[y, x].cell_type
-                if cell_type != CellType.EMPTY:
-                    counts[cell_type] += 1
-        
-        for cell_type in counts:
-            self.population_history[cell_type].append(counts[cell_type])
-            if len(self.population_history[cell_type]) > 1000:
-                self.population_history[cell_type] = self.population_history[cell_type][-1000:]
+        counts = self._population_bincount()
+        self.population_history[:, self.history_index % self.history_length] = counts[1:]
+        self.history_index += 1
+
+    def get_population_history(self, cell_type: CellType) -> np.ndarray:
+        # Chronological view of one species' ring-buffer row
+        row = self.population_history[cell_type.value - 1]
+        if self.history_index <= self.history_length:
+            return row[:self.history_index]
+        return np.roll(row, -(self.history_index % self.history_length))
 
     def set_cell(self, x: int, y: int, cell_type: CellType, energy: float = 1.0):
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.grid[y, x] = Cell(
-                cell_type=cell_type,
-                energy=energy,
-                quantum_phase=random.random() * 2 * np.pi if cell_type == CellType.QUANTUM else 0.0
-            )
+            self.cell_type[y, x] = cell_type.value
+            self.energy[y, x] = energy
+            self.age[y, x] = 0
+            self.mutation_rate[y, x] = 0.01
+            self.quantum_phase[y, x] = (
+                random.random() * 2 * np.pi if cell_type == CellType.QUANTUM else 0.0)
+            self.mark_grid_dirty()
+
+    def set_cells_bulk(self, x: np.ndarray, y: np.ndarray,
+                       cell_types: np.ndarray, energy: float = 1.0):
+        # Vector counterpart of set_cell: writes the same fresh record
+        # for every (x, y); callers are responsible for bounds
+        self.cell_type[y, x] = cell_types
+        self.energy[y, x] = energy
+        self.age[y, x] = 0
+        self.mutation_rate[y, x] = 0.01
+        self.quantum_phase[y, x] = np.where(
+            cell_types == CellType.QUANTUM.value,
+            np.random.random(np.size(cell_types)) * 2 * np.pi, 0.0)
+        self.mark_grid_dirty()
 
     def get_cell(self, x: int, y: int) -> Optional[Cell]:
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[y, x]
+            return Cell(
+                cell_type=CellType(self.cell_type[y, x]),
+                energy=float(self.energy[y, x]),
+                age=int(self.age[y, x]),
+                mutation_rate=float(self.mutation_rate[y, x]),
+                quantum_phase=float(self.quantum_phase[y, x])
+            )
         return None
 
     def resize_grid(self, new_width: int, new_height: int):
-        old_grid = self.grid.copy()
+        old_arrays = (self.cell_type, self.energy, self.age,
+                      self.mutation_rate, self.quantum_phase)
         old_width, old_height = self.width, self.height
-        
+
         self.width = new_width
         self.height = new_height
-        self.grid = np.zeros((new_height, new_width), dtype=object)
-        self.next_grid = np.zeros((new_height, new_width), dtype=object)
-        
-        for y in range(new_height):
-            for x in range(new_width):
-                self.grid[y, x] = Cell()
-                self.next_grid[y, x] = Cell()
-        
+        shape = (new_height, new_width)
+
+        self.wrap_x = np.arange(-new_width, 2 * new_width) % new_width
+        self.wrap_y = np.arange(-new_height, 2 * new_height) % new_height
+
+        self.cell_type = np.zeros(shape, dtype=np.uint8)
+        self.energy = np.zeros(shape, dtype=np.float32)
+        self.age = np.zeros(shape, dtype=np.int32)
+        self.mutation_rate = np.full(shape, 0.01, dtype=np.float32)
+        self.quantum_phase = np.zeros(shape, dtype=np.float32)
+
+        self.next_cell_type = np.zeros(shape, dtype=np.uint8)
+        self.next_energy = np.zeros(shape, dtype=np.float32)
+        self.next_age = np.zeros(shape, dtype=np.int32)
+        self.next_mutation_rate = np.full(shape, 0.01, dtype=np.float32)
+        self.next_quantum_phase = np.zeros(shape, dtype=np.float32)
+
         copy_width = min(old_width, new_width)
         copy_height = min(old_height, new_height)
-        
-        for y in range(copy_height):
-            for x in range(copy_width):
-                self.grid[y, x] = old_grid[y, x]
+
+        for old, new in zip(old_arrays, (self.cell_type, self.energy, self.age,
+                                         self.mutation_rate, self.quantum_phase)):
+            new[:copy_height, :copy_width] = old[:copy_height, :copy_width]
+
+        self.mark_grid_dirty()
 
     def clear_grid(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                self.grid[y, x] = Cell()
+        self.cell_type.fill(0)
+        self.energy.fill(0.0)
+        self.age.fill(0)
+        self.mutation_rate.fill(0.01)
+        self.quantum_phase.fill(0.0)
         self.generation = 0
-        self.population_history = {cell_type: [] for cell_type in CellType if cell_type != CellType.EMPTY}
+        self.population_history.fill(0)
+        self.history_index = 0
+        self.mark_grid_dirty()
 
     def get_population_counts(self) -> Dict[CellType, int]:
-        counts = {cell_type: 0 for cell_type in CellType}
-        for y in range(self.height):
-            for x in range(self.width):
-                counts[self.grid[y, x].cell_type] += 1
-        return counts
+        # The dict is rebuilt only when a fresh bincount was computed;
+        # repeated calls within a frame return the same object
+        counts = self._population_bincount()
+        if self._counts_dict_src is not counts:
+            self._counts_dict = {cell_type: int(counts[cell_type.value]) for cell_type in CellType}
+            self._counts_dict_src = counts
+        return self._counts_dict
+
+    def get_population_counts_vec(self) -> np.ndarray:
+        # Length-5 bincount indexed by CellType value; shared cached
+        # array, callers must not mutate it
+        return self._population_bincount()
 
     def calculate_entropy(self) -> float:
-        counts = self.get_population_counts()
-        total = sum(counts.values())
+        counts = self._population_bincount()
+        total = counts.sum()
         if total == 0:
             return 0.0
-        
-        entropy = 0.0
-        for count in counts.values():
-            if count > 0:
-                p = count / total
-                entropy -= p * np.log2(p)
-        return entropy
\ No newline at end of file
+
+        probabilities = counts[counts > 0] / total
+        return float(-np.sum(probabilities * np.log2(probabilities)))
@@ -1,13 +1,29 @@
 import pygame
 import sys
+import csv
 import time
+import queue
+import threading
+import traceback
+import numpy as np
+from dataclasses import dataclass
 from game_core import GameOfLife, CellType
 from visualization import Visualizer
-from ui_controller import UIController
-from events import EventSystem
+from ui_controller import UIController, _get_font
+from events import EventSystem, EventType
 from stats import StatisticsTracker
 from patterns import PatternLibrary
 
+@dataclass(frozen=True, slots=True)
+class Layout:
+    screen_w: int
+    screen_h: int
+    cell_size: int
+    panel_w: int
+    grid_w: int
+    grid_h: int
+
+
 class QuantumLifeGame:
     def __init__(self):
         # Initialize Pygame
@@ -24,21 +40,17 @@ class QuantumLifeGame:
         self.MIN_CELL_SIZE = 3
         self.MAX_CELL_SIZE = 20
         
-        # Calculate optimal grid and screen size
-        ui_panel_width = int(available_width * 0.22)
-        ui_panel_width = max(240, min(320, ui_panel_width))
-        
-        game_area_width = available_width - ui_panel_width
-        game_area_height = available_height
-        
-        self.GRID_WIDTH = game_area_width // self.CELL_SIZE
-        self.GRID_HEIGHT = game_area_height // self.CELL_SIZE
-        
-        self.GRID_WIDTH = max(80, self.GRID_WIDTH)
-        self.GRID_HEIGHT = max(60, self.GRID_HEIGHT)
-        
-        self.SCREEN_WIDTH = self.GRID_WIDTH * self.CELL_SIZE + ui_panel_width
-        self.SCREEN_HEIGHT = self.GRID_HEIGHT * self.CELL_SIZE
+        # Calculate optimal grid and screen size; the window wraps the
+        # grid exactly, so recompute the layout from the final dimensions
+        fit = self._compute_layout(available_width, available_height,
+                                   self.CELL_SIZE, 80, 60)
+        self.GRID_WIDTH = fit.grid_w
+        self.GRID_HEIGHT = fit.grid_h
+        self.SCREEN_WIDTH = fit.grid_w * self.CELL_SIZE + fit.panel_w
+        self.SCREEN_HEIGHT = fit.grid_h * self.CELL_SIZE
+        self._layout = Layout(self.SCREEN_WIDTH, self.SCREEN_HEIGHT,
+                              self.CELL_SIZE, fit.panel_w,
+                              self.GRID_WIDTH, self.GRID_HEIGHT)
         self.FPS = 60
         
         self.game = GameOfLife(self.GRID_WIDTH, self.GRID_HEIGHT)
@@ -48,13 +60,65 @@ class QuantumLifeGame:
         self.stats = StatisticsTracker(self.game)
         
         # Pygame setup with resizable window
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.RESIZABLE)
+        self.screen = pygame.display.set_mode(
+            (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+            pygame.RESIZABLE | pygame.DOUBLEBUF)
         pygame.display.set_caption("Quantum Life - Enhanced Conway's Game of Life")
         self.clock = pygame.time.Clock()
+        self._full_redraw = True
         
         self.visualizer.initialize_surfaces(self.screen)
-        self.last_update_time = time.time()
         self.update_interval = 1.0 / 5.0
+        self._step_accum = 0.0
+
+        # Drag-resize debounce: apply the last VIDEORESIZE only after the
+        # stream of events has gone quiet
+        self._pending_resize = None
+        self._pending_resize_time = 0.0
+
+        # Stats aggregation runs on a worker thread ticked once per sim
+        # step; None is the shutdown sentinel. The worker streams rows to
+        # disk as it goes, so quitting (or crashing) loses at most the
+        # unflushed tail instead of the whole run
+        self._stats_q: queue.Queue = queue.Queue(maxsize=2)
+        self._stats_file = open("final_stats.csv", "w", newline="")
+        self._stats_csv = csv.writer(self._stats_file)
+        self._stats_csv.writerow([
+            'generation', 'total_pop', 'red', 'green', 'blue', 'quantum',
+            'entropy', 'energy', 'diversity', 'birth_rate', 'death_rate',
+            'stability', 'fractal_dim'])
+        self._stats_thread = threading.Thread(target=self._stats_worker, daemon=True)
+        self._stats_thread.start()
+
+        # Reused scratch buffer for quantum-storm flicker points, plus a
+        # 256-entry angle table so the render loop never calls trig
+        self._storm_buf = np.empty((10, 2), dtype=np.int32)
+        angles = np.linspace(0, 2 * np.pi, 256, endpoint=False)
+        self._cos_lut = np.cos(angles)
+        self._sin_lut = np.sin(angles)
+
+        # Pre-rendered particle sprites keyed by (r, g, b, alpha bucket);
+        # 16 alpha buckets bound the cache to a few dozen surfaces
+        self._particle_cache: dict = {}
+
+        # Pre-rendered event rings keyed by (radius bucket, thickness,
+        # color); radius quantized to 2 px, channels to 16 levels
+        self._ring_cache: dict = {}
+
+        # Per-type draw dispatch on enum identity; types without a
+        # visual just draw their particles
+        self._effect_draw = {
+            EventType.METEOR: self._draw_meteor,
+            EventType.ENERGY_WAVE: self._draw_wave,
+            EventType.QUANTUM_STORM: self._draw_storm,
+        }
+
+        # Edge-triggered mouse state, maintained from the event queue so
+        # update() never has to poll SDL
+        self._mouse_down_left = False
+        self._mouse_pos = (0, 0)
+        self._last_paint_pos = None
+        self._viz_flags = (None, None, None)
         
         self._load_demo_pattern()
 
@@ -67,121 +131,197 @@ class QuantumLifeGame:
         pattern_lib.place_pattern(self.game, "Gosper Glider Gun", 10, 50, CellType.RED)
 
     def handle_events(self):
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
-            
+
             if event.type == pygame.VIDEORESIZE:
-                self.handle_resize(event.w, event.h)
-            
-            should_step = self.ui_controller.handle_event(event, self.event_system, self.stats)
-            if should_step:
-                self.step_simulation()
-            
+                self._pending_resize = (event.w, event.h)
+                self._pending_resize_time = time.monotonic()
+
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                self._mouse_pos = event.pos
                 if event.button == 1:
+                    self._mouse_down_left = True
                     self.ui_controller.drawing_mode = True
                 elif event.button == 3:
-                    self.ui_controller.handle_pattern_placement(mouse_pos, self.visualizer)
+                    self.ui_controller.handle_pattern_placement(event.pos, self.visualizer)
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:
+                    self._mouse_down_left = False
                     self.ui_controller.drawing_mode = False
                     self.ui_controller.drawing_started = False
+            elif event.type == pygame.MOUSEMOTION:
+                self._mouse_pos = event.pos
             elif event.type == pygame.MOUSEWHEEL:
                 self.handle_zoom(event.y)
-        
+
+        # UI widgets get the whole batch at once so motion floods coalesce
+        if self.ui_controller.handle_events(events, self.event_system, self.stats):
+            self.step_simulation()
+
         return True
 
-    def handle_resize(self, new_width: int, new_height: int):
-        self.SCREEN_WIDTH = max(800, new_width)
-        self.SCREEN_HEIGHT = max(600, new_height)
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.RESIZABLE)
-        
-        ui_panel_width = int(self.SCREEN_WIDTH * 0.22)
-        ui_panel_width = max(240, min(320, ui_panel_width))
-        
-        game_area_width = self.SCREEN_WIDTH - ui_panel_width
-        game_area_height = self.SCREEN_HEIGHT
-        
-        new_grid_width = game_area_width // self.CELL_SIZE
-        new_grid_height = game_area_height // self.CELL_SIZE
-        
-        new_grid_width = max(40, new_grid_width)
-        new_grid_height = max(30, new_grid_height)
-        
-        if new_grid_width != self.GRID_WIDTH or new_grid_height != self.GRID_HEIGHT:
-            self.GRID_WIDTH = new_grid_width
-            self.GRID_HEIGHT = new_grid_height
-            self.game.resize_grid(self.GRID_WIDTH, self.GRID_HEIGHT)
-        
-        self.ui_controller.resize(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+    @staticmethod
+    def _compute_layout(screen_w: int, screen_h: int, cell_size: int,
+                        min_grid_w: int = 40, min_grid_h: int = 30) -> Layout:
+        panel_w = max(240, min(320, int(screen_w * 0.22)))
+        grid_w = max(min_grid_w, (screen_w - panel_w) // cell_size)
+        grid_h = max(min_grid_h, screen_h // cell_size)
+        return Layout(screen_w, screen_h, cell_size, panel_w, grid_w, grid_h)
+
+    def _apply_layout(self, layout: Layout):
+        old, self._layout = self._layout, layout
+
+        if (layout.screen_w, layout.screen_h) != (old.screen_w, old.screen_h):
+            self.SCREEN_WIDTH = layout.screen_w
+            self.SCREEN_HEIGHT = layout.screen_h
+            self.screen = pygame.display.set_mode(
+                (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+                pygame.RESIZABLE | pygame.DOUBLEBUF)
+            self.ui_controller.resize(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+
+        self.CELL_SIZE = layout.cell_size
+        self.visualizer.cell_size = layout.cell_size
+
+        if (layout.grid_w, layout.grid_h) != (old.grid_w, old.grid_h):
+            self.GRID_WIDTH = layout.grid_w
+            self.GRID_HEIGHT = layout.grid_h
+            self.game.resize_grid(layout.grid_w, layout.grid_h)
+
+        self.visualizer.screen_width = layout.grid_w * layout.cell_size
+        self.visualizer.screen_height = layout.grid_h * layout.cell_size
         self.visualizer.initialize_surfaces(self.screen)
+        self._full_redraw = True
+
+    def handle_resize(self, new_width: int, new_height: int):
+        new = self._compute_layout(max(800, new_width), max(600, new_height),
+                                   self.CELL_SIZE)
+        if new != self._layout:
+            self._apply_layout(new)
 
     def handle_zoom(self, zoom_direction: int):
         if zoom_direction > 0:
             new_cell_size = min(self.MAX_CELL_SIZE, self.CELL_SIZE + 1)
         else:
             new_cell_size = max(self.MIN_CELL_SIZE, self.CELL_SIZE - 1)
-        
-        if new_cell_size != self.CELL_SIZE:
-            self.CELL_SIZE = new_cell_size
-            self.visualizer.cell_size = self.CELL_SIZE
-            
-            ui_panel_width = int(self.SCREEN_WIDTH * 0.22)
-            ui_panel_width = max(240, min(320, ui_panel_width))
-            game_area_width = self.SCREEN_WIDTH - ui_panel_width
-            game_area_height = self.SCREEN_HEIGHT
-            
-            new_grid_width = game_area_width // self.CELL_SIZE
-            new_grid_height = game_area_height // self.CELL_SIZE
-            new_grid_width = max(40, new_grid_width)
-            new_grid_height = max(30, new_grid_height)
-            
-            if new_grid_width != self.GRID_WIDTH or new_grid_height != self.GRID_HEIGHT:
-                self.GRID_WIDTH = new_grid_width
-                self.GRID_HEIGHT = new_grid_height
-                self.game.resize_grid(self.GRID_WIDTH, self.GRID_HEIGHT)
-            
-            self.visualizer.screen_width = self.GRID_WIDTH * self.CELL_SIZE
-            self.visualizer.screen_height = self.GRID_HEIGHT * self.CELL_SIZE
-            self.visualizer.initialize_surfaces(self.screen)
+
+        new = self._compute_layout(self.SCREEN_WIDTH, self.SCREEN_HEIGHT,
+                                   new_cell_size)
+        if new != self._layout:
+            self._apply_layout(new)
 
     def update(self, dt):
+        self._frame_update(dt)
+        self._fixed_update(dt)
+
+    def _frame_update(self, dt):
+        # Per-render-frame work: UI, input, cosmetic event animation
+        if (self._pending_resize is not None and
+                time.monotonic() - self._pending_resize_time > 0.15):
+            self.handle_resize(*self._pending_resize)
+            self._pending_resize = None
+
         self.ui_controller.update(dt)
-        self.stats.update()
         self.event_system.update()
-        self.event_system.apply_event_effects()
-        
-        mouse_buttons = pygame.mouse.get_pressed()
-        if mouse_buttons[0]:
-            mouse_pos = pygame.mouse.get_pos()
-            if mouse_pos[0] < self.SCREEN_WIDTH - self.ui_controller.panel_width:
-                self.ui_controller.handle_mouse_input(mouse_pos, mouse_buttons, self.visualizer)
         
-        self.visualizer.show_grid = self.ui_controller.show_grid
-        self.visualizer.show_energy = self.ui_controller.show_energy
-        self.visualizer.show_age = self.ui_controller.show_age
-        
-        current_time = time.time()
-        speed_multiplier = self.ui_controller.get_speed_multiplier()
-        adjusted_interval = self.update_interval / speed_multiplier
+        # Paint only when the cursor moved (or on the first frame of a
+        # press), interpolating between samples so fast drags don't skip
+        if self._mouse_down_left:
+            if self._mouse_pos != self._last_paint_pos:
+                if self._mouse_pos[0] < self.SCREEN_WIDTH - self.ui_controller.panel_width:
+                    self.ui_controller.paint_line(
+                        self._last_paint_pos or self._mouse_pos,
+                        self._mouse_pos, self.visualizer)
+                self._last_paint_pos = self._mouse_pos
+        else:
+            self._last_paint_pos = None
+
+        # Push display toggles to the visualizer only when they change
+        flags = (self.ui_controller.show_grid, self.ui_controller.show_energy,
+                 self.ui_controller.show_age)
+        if flags != self._viz_flags:
+            self._viz_flags = flags
+            self.visualizer.show_grid, self.visualizer.show_energy, self.visualizer.show_age = flags
         
-        if (self.ui_controller.get_simulation_should_run() and 
-            current_time - self.last_update_time >= adjusted_interval):
-            self.step_simulation()
-            self.last_update_time = current_time
+    def _fixed_update(self, dt):
+        # Speed-scaled frame-time accumulator; the loop lets a stalled
+        # frame catch up with a few sim steps. The clamp bounds the debt
+        # a long stall (e.g. first-call numba compilation) can queue, so
+        # a slow step can never spiral into an ever-growing backlog
+        if self.ui_controller.get_simulation_should_run():
+            self._step_accum += dt * self.ui_controller.get_speed_multiplier()
+            self._step_accum = min(self._step_accum, 5 * self.update_interval)
+            while self._step_accum >= self.update_interval:
+                self.step_simulation()
+                self._step_accum -= self.update_interval
+        else:
+            self._step_accum = 0.0
 
     def step_simulation(self):
+        # Grid-mutating event effects apply at sim rate, not frame rate
+        self.event_system.apply_event_effects()
         self.game.update()
+        # Hand the worker an immutable snapshot; reading live game arrays
+        # from the stats thread would race the next step's in-place writes
+        try:
+            self._stats_q.put_nowait(self.stats.snapshot())
+        except queue.Full:
+            pass
+
+    def _stats_worker(self):
+        while True:
+            snapshot = self._stats_q.get()
+            if snapshot is None:
+                break
+            # A bad row must not kill the thread and silently end the
+            # CSV stream for the rest of the run
+            try:
+                self.stats.update(snapshot)
+                current = self.stats.get_current_stats()
+                if current:
+                    populations = current['populations']
+                    self._stats_csv.writerow([
+                        current['generation'], current['total_population'],
+                        populations['red'], populations['green'],
+                        populations['blue'], populations['quantum'],
+                        current['entropy'], current['energy'],
+                        current['diversity_index'], current['birth_rate'],
+                        current['death_rate'], current['stability_index'],
+                        current['fractal_dimension']])
+                    if current['generation'] % 50 == 0:
+                        self._stats_file.flush()
+            except Exception:
+                traceback.print_exc()
+        self._stats_file.close()
 
     def render(self):
-        self.screen.fill((0, 0, 0))
+        # Only the grid area and UI panel repaint each frame; the gutter
+        # between them stays black, so restrict clears and the display
+        # update to those two rects
+        grid_rect = pygame.Rect(0, 0, self.GRID_WIDTH * self.CELL_SIZE,
+                                self.GRID_HEIGHT * self.CELL_SIZE)
+        panel_rect = pygame.Rect(
+            self.SCREEN_WIDTH - self.ui_controller.panel_width, 0,
+            self.ui_controller.panel_width, self.SCREEN_HEIGHT)
+
+        if self._full_redraw:
+            self.screen.fill((0, 0, 0))
+        else:
+            self.screen.fill((0, 0, 0), grid_rect)
+            self.screen.fill((0, 0, 0), panel_rect)
+
         self.visualizer.render(self.screen)
         self._render_events()
         self.ui_controller.draw(self.screen)
         self._draw_debug_info()
-        pygame.display.flip()
+
+        if self._full_redraw:
+            self._full_redraw = False
+            pygame.display.flip()
+        else:
+            pygame.display.update((grid_rect, panel_rect))
 
     def _render_events(self):
         for event in self.event_system.active_events:
@@ -191,45 +331,85 @@ class QuantumLifeGame:
         center_x = event.x * self.CELL_SIZE + self.CELL_SIZE // 2
         center_y = event.y * self.CELL_SIZE + self.CELL_SIZE // 2
         
-        if event.event_type.value == 'meteor':
-            radius = int(event.radius * self.CELL_SIZE * event.get_age_factor())
-            if radius > 0:
-                color = (255, int(200 * (1 - event.get_age_factor())), 0)
-                pygame.draw.circle(self.screen, color, (center_x, center_y), radius, 2)
-        
-        elif event.event_type.value == 'energy_wave':
-            wave_radius = int(event.radius * self.CELL_SIZE * event.get_age_factor())
-            if wave_radius > 0:
-                color = (0, 255, 255, int(100 * (1 - event.get_age_factor())))
-                pygame.draw.circle(self.screen, color, (center_x, center_y), wave_radius, 3)
-        
-        elif event.event_type.value == 'quantum_storm':
-            import random
-            import math
-            for i in range(10):
-                angle = random.random() * 2 * math.pi
-                distance = random.random() * event.radius * self.CELL_SIZE
-                x = center_x + int(math.cos(angle) * distance)
-                y = center_y + int(math.sin(angle) * distance)
-                pygame.draw.circle(self.screen, (255, 255, 255), (x, y), 2)
-        
-        for particle in event.particles:
-            if particle['life'] > 0:
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                color = (*particle['color'], alpha)
-                particle_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color, (3, 3), 3)
-                self.screen.blit(particle_surface, (int(particle['x'] - 3), int(particle['y'] - 3)))
+        draw = self._effect_draw.get(event.event_type)
+        if draw is not None:
+            draw(event, center_x, center_y)
+
+        alive = np.nonzero(event.plife > 0)[0]
+        if alive.size:
+            alphas = (255 * event.plife[alive] / event.pmax_life[alive]).astype(np.int32) & 0xF0
+            xs = (event.px[alive] - 3).astype(np.int32)
+            ys = (event.py[alive] - 3).astype(np.int32)
+            blit_seq = []
+            for i, idx in enumerate(alive):
+                key = (int(event.pcolor[idx, 0]), int(event.pcolor[idx, 1]),
+                       int(event.pcolor[idx, 2]), int(alphas[i]))
+                sprite = self._particle_cache.get(key)
+                if sprite is None:
+                    sprite = pygame.Surface((6, 6), pygame.SRCALPHA)
+                    pygame.draw.circle(sprite, key, (3, 3), 3)
+                    self._particle_cache[key] = sprite
+                blit_seq.append((sprite, (xs[i], ys[i])))
+            self.screen.blits(blit_seq, doreturn=False)
+
+    def _draw_meteor(self, event, center_x: int, center_y: int):
+        age_factor = event.get_age_factor()
+        radius = int(event.radius * self.CELL_SIZE * age_factor)
+        if radius > 0:
+            color = (255, int(200 * (1 - age_factor)) & 0xF0, 0)
+            self._blit_ring(center_x, center_y, radius, 2, color)
+
+    def _draw_wave(self, event, center_x: int, center_y: int):
+        age_factor = event.get_age_factor()
+        wave_radius = int(event.radius * self.CELL_SIZE * age_factor)
+        if wave_radius > 0:
+            color = (0, 255, 255, int(100 * (1 - age_factor)) & 0xF0)
+            self._blit_ring(center_x, center_y, wave_radius, 3, color)
+
+    def _draw_storm(self, event, center_x: int, center_y: int):
+        dot = self._get_ring(2, 0, (255, 255, 255))
+        for x, y in self._storm_points(center_x, center_y,
+                                       event.radius * self.CELL_SIZE):
+            self.screen.blit(dot, (int(x) - 2, int(y) - 2))
+
+    def _get_ring(self, radius: int, thickness: int, color) -> pygame.Surface:
+        key = (radius, thickness, color)
+        sprite = self._ring_cache.get(key)
+        if sprite is None:
+            size = radius * 2 + 1
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius, thickness)
+            self._ring_cache[key] = sprite
+        return sprite
+
+    def _blit_ring(self, center_x: int, center_y: int, radius: int,
+                   thickness: int, color):
+        radius = max(1, radius - (radius & 1))
+        sprite = self._get_ring(radius, thickness, color)
+        self.screen.blit(sprite, (center_x - radius, center_y - radius))
+
+    def _storm_points(self, center_x: int, center_y: int, radius_px: float) -> np.ndarray:
+        idx = np.random.randint(0, 256, 10)
+        distances = np.random.random(10) * radius_px
+        self._storm_buf[:, 0] = center_x + self._cos_lut[idx] * distances
+        self._storm_buf[:, 1] = center_y + self._sin_lut[idx] * distances
+        return self._storm_buf
 
     def _draw_debug_info(self):
         if not hasattr(self, '_debug_font'):
-            self._debug_font = pygame.font.Font(None, 20)
-        
+            self._debug_font = _get_font(20)
+            self._text_cache: dict = {}
+
         if self.event_system.active_events:
             y_offset = 50
             for i, event in enumerate(self.event_system.active_events[:5]):
                 event_text = f"{event.event_type.value}: {event.duration}/{event.max_duration}"
-                text_surface = self._debug_font.render(event_text, True, (255, 255, 0))
+                text_surface = self._text_cache.get(event_text)
+                if text_surface is None:
+                    text_surface = self._debug_font.render(event_text, True, (255, 255, 0))
+                    if len(self._text_cache) >= 64:
+                        self._text_cache.pop(next(iter(self._text_cache)))
+                    self._text_cache[event_text] = text_surface
                 self.screen.blit(text_surface, (10, y_offset + i * 20))
 
     def run(self):
@@ -244,10 +424,9 @@ class QuantumLifeGame:
         self.quit()
 
     def quit(self):
-        try:
-            self.stats.export_data("final_stats.csv")
-        except Exception:
-            pass
+        # Rows are already on disk; shutdown just drains and closes
+        self._stats_q.put(None)
+        self._stats_thread.join(timeout=0.5)
         pygame.quit()
         sys.exit()
 
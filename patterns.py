@@ -1,23 +1,52 @@
+import numpy as np
 from typing import List, Tuple, Dict
 from game_core import CellType
 
 class Pattern:
-    def __init__(self, name: str, pattern: List[List[int]], 
-                 description: str = "", cell_type: CellType = CellType.RED):
+    def __init__(self, name: str, pattern, description: str = "",
+                 cell_type: CellType = CellType.RED):
         self.name = name
-        self.pattern = pattern
         self.description = description
         self.cell_type = cell_type
-        self.width = len(pattern[0]) if pattern else 0
-        self.height = len(pattern)
+
+        # Dense uint8 array is the canonical storage; nested int lists
+        # are accepted and converted
+        arr = np.asarray(pattern, dtype=np.uint8)
+        if arr.ndim != 2:
+            arr = np.zeros((0, 0), dtype=np.uint8)
+        self.pattern_arr = arr
+        self.height, self.width = arr.shape
+
+        # Patterns are immutable after construction, so enumerate the
+        # occupied cells once up front
+        ys, xs = np.nonzero(arr)
+        self._cells_xy = np.stack([xs, ys], axis=1).astype(np.int32)
+        self._cell_values = arr[ys, xs]
+        self._plain_cells = [(int(x), int(y))
+                             for (x, y), v in zip(self._cells_xy, self._cell_values)
+                             if v == 1]
+
+        # Resolved species per default cell type, built lazily; most
+        # patterns are only ever placed with one or two types
+        self._species_cache = {}
+
+    def resolved_species(self, cell_type_value: int) -> np.ndarray:
+        cached = self._species_cache.get(cell_type_value)
+        if cached is None:
+            v = self._cell_values
+            cached = np.where(v == 2, CellType.GREEN.value,
+                     np.where(v == 3, CellType.BLUE.value,
+                     np.where(v == 4, CellType.QUANTUM.value,
+                              cell_type_value))).astype(np.uint8)
+            self._species_cache[cell_type_value] = cached
+        return cached
+
+    @property
+    def pattern(self) -> List[List[int]]:
+        return self.pattern_arr.tolist()
 
     def get_cells(self) -> List[Tuple[int, int]]:
-        cells = []
-        for y, row in enumerate(self.pattern):
-            for x, cell in enumerate(row):
-                if cell == 1:
-                    cells.append((x, y))
-        return cells
+        return self._plain_cells
 
 class PatternLibrary:
     def __init__(self):
@@ -156,15 +185,9 @@ class PatternLibrary:
         self.add_pattern("Random Medium", self._generate_random_pattern(10, 10, 0.2),
                         "Medium random pattern")
 
-    def _generate_random_pattern(self, width: int, height: int, density: float) -> List[List[int]]:
-        import random
-        pattern = []
-        for _ in range(height):
-            row = []
-            for _ in range(width):
-                row.append(1 if random.random() < density else 0)
-            pattern.append(row)
-        return pattern
+    def _generate_random_pattern(self, width: int, height: int, density: float) -> np.ndarray:
+        rng = np.random.default_rng()
+        return (rng.random((height, width)) < density).astype(np.uint8)
 
     def add_pattern(self, name: str, pattern: List[List[int]], 
                    description: str = "", cell_type: CellType = CellType.RED):
@@ -218,43 +241,32 @@ class PatternLibrary:
         # Use pattern's default cell type if none specified
         if cell_type is None:
             cell_type = pattern.cell_type
-        
-        # Place the pattern on the grid
-        for py, row in enumerate(pattern.pattern):
-            for px, cell_value in enumerate(row):
-                if cell_value > 0:
-                    grid_x = x + px
-                    grid_y = y + py
-                    
-                    # Determine cell type based on pattern value
-                    if cell_value == 1:
-                        place_type = cell_type
-                    elif cell_value == 2:
-                        place_type = CellType.GREEN
-                    elif cell_value == 3:
-                        place_type = CellType.BLUE
-                    elif cell_value == 4:
-                        place_type = CellType.QUANTUM
-                    else:
-                        place_type = cell_type
-                    
-                    if (0 <= grid_x < game.width and 0 <= grid_y < game.height):
-                        game.set_cell(grid_x, grid_y, place_type)
-        
+
+        if pattern._cells_xy.shape[0] == 0:
+            return True
+
+        # Pattern value -> placed species; 1 maps to the requested type,
+        # 2/3/4 keep their own species. Resolved once per type per
+        # pattern and cached.
+        species = pattern.resolved_species(cell_type.value)
+
+        xs, ys = pattern._cells_xy.T
+        grid_x = xs + x
+        grid_y = ys + y
+        inside = ((grid_x >= 0) & (grid_x < game.width) &
+                  (grid_y >= 0) & (grid_y < game.height))
+        game.set_cells_bulk(grid_x[inside], grid_y[inside], species[inside])
+
         return True
 
-    def create_symmetric_pattern(self, base_pattern: List[List[int]], 
-                                symmetry_type: str = "horizontal") -> List[List[int]]:
+    def create_symmetric_pattern(self, base_pattern,
+                                symmetry_type: str = "horizontal") -> np.ndarray:
+        base = np.asarray(base_pattern, dtype=np.uint8)
         if symmetry_type == "horizontal":
-            return base_pattern + [row[::-1] for row in reversed(base_pattern)]
+            return np.vstack([base, base[::-1, ::-1]])
         elif symmetry_type == "vertical":
-            return base_pattern + [row for row in reversed(base_pattern)]
+            return np.vstack([base, base[::-1]])
         elif symmetry_type == "diagonal":
-            # Transpose the pattern
-            height = len(base_pattern)
-            width = len(base_pattern[0]) if height > 0 else 0
-            transposed = [[base_pattern[y][x] for y in range(height)] 
-                         for x in range(width)]
-            return base_pattern + transposed
+            return np.vstack([base, base.T])
         else:
-            return base_pattern
\ No newline at end of file
+            return base
\ No newline at end of file
@@ -1,212 +1,422 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from collections import deque
-import pygame
-import math
+from dataclasses import dataclass
 from game_core import GameOfLife, CellType
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _linreg_slope(x, y):
+    # Least-squares slope of y over x; 0.0 on a degenerate fit
+    n = x.shape[0]
+    sum_x = sum_y = sum_xy = sum_x2 = 0.0
+    for i in range(n):
+        sum_x += x[i]
+        sum_y += y[i]
+        sum_xy += x[i] * y[i]
+        sum_x2 += x[i] * x[i]
+    denom = n * sum_x2 - sum_x * sum_x
+    if denom == 0.0:
+        return 0.0
+    return (n * sum_xy - sum_x * sum_y) / denom
+
+def _osc_stats(a):
+    # Peak count and peak-interval mean/variance in one pass
+    n = a.shape[0]
+    peak_count = 0
+    last_peak = -1
+    iv_count = 0
+    iv_sum = 0.0
+    iv_sqsum = 0.0
+    for i in range(1, n - 1):
+        if a[i] > a[i - 1] and a[i] > a[i + 1]:
+            if last_peak >= 0:
+                iv = float(i - last_peak)
+                iv_count += 1
+                iv_sum += iv
+                iv_sqsum += iv * iv
+            last_peak = i
+            peak_count += 1
+    if iv_count == 0:
+        return peak_count, 0.0, 0.0
+    mean = iv_sum / iv_count
+    variance = iv_sqsum / iv_count - mean * mean
+    if variance < 0.0:
+        variance = 0.0
+    return peak_count, mean, variance
+
+if NUMBA_AVAILABLE:
+    _linreg_slope = njit(cache=True, fastmath=True)(_linreg_slope)
+    _osc_stats = njit(cache=True, fastmath=True)(_osc_stats)
+
+# x coordinates of the box-counting fit never change
+_LOG_SCALES = np.log(1.0 / np.array([1, 2, 4, 8], dtype=np.float64))
+
+class RingBuffer:
+    # Fixed-capacity history backed by a float64 array; recent() hands
+    # out a view when the window does not straddle the wrap point
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buf = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+
+    def append(self, value: float):
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def recent(self, n: int = None) -> np.ndarray:
+        # Last n values, oldest first
+        if n is None or n > self._size:
+            n = self._size
+        start = self._head - n
+        if start >= 0:
+            return self._buf[start:self._head]
+        return np.concatenate([self._buf[start:], self._buf[:self._head]])
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return float(self._buf[(self._head - self._size + index) % self.capacity])
+
+class PopulationMatrix:
+    # Per-species history as rows of one (4, capacity) int32 matrix so
+    # cross-species reductions run over contiguous memory; totals are
+    # derived with sum(axis=0) instead of being stored separately
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._mat = np.zeros((4, capacity), dtype=np.int32)
+        self._head = 0
+        self._size = 0
+
+    def append(self, counts: np.ndarray):
+        self._mat[:, self._head] = counts
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def recent(self, n: int = None) -> np.ndarray:
+        # Last n columns, oldest first, as a (4, n) block
+        if n is None or n > self._size:
+            n = self._size
+        start = self._head - n
+        if start >= 0:
+            return self._mat[:, start:self._head]
+        return np.concatenate([self._mat[:, start:], self._mat[:, :self._head]], axis=1)
+
+    def species(self, i: int, window: int = None) -> np.ndarray:
+        # Row i over the last `window` samples; a view when the window
+        # does not straddle the wrap point
+        if window is None or window > self._size:
+            window = self._size
+        start = self._head - window
+        if start >= 0:
+            return self._mat[i, start:self._head]
+        return np.concatenate([self._mat[i, start:], self._mat[i, :self._head]])
+
+    def totals(self, window: int = None) -> np.ndarray:
+        return self.recent(window).sum(axis=0)
+
+    def last_column(self) -> np.ndarray:
+        return self._mat[:, (self._head - 1) % self.capacity]
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
+@dataclass(frozen=True, slots=True)
+class StatsSnapshot:
+    # Immutable copy of the per-generation inputs the tracker consumes,
+    # taken on the simulation thread so update() can run elsewhere
+    # without racing the engine's in-place grid writes
+    generation: int
+    grid_hash: int
+    counts: np.ndarray
+    total_energy: float
+    entropy: float
+    last_births: int
+    last_deaths: int
+    alive_mask: np.ndarray
+
+
 class StatisticsTracker:
     def __init__(self, game: GameOfLife, max_history: int = 1000):
         self.game = game
         self.max_history = max_history
         
-        self.population_history = {
-            CellType.RED: deque(maxlen=max_history),
-            CellType.GREEN: deque(maxlen=max_history),
-            CellType.BLUE: deque(maxlen=max_history),
-            CellType.QUANTUM: deque(maxlen=max_history)
-        }
-        
-        self.total_population_history = deque(maxlen=max_history)
-        self.entropy_history = deque(maxlen=max_history)
-        self.energy_history = deque(maxlen=max_history)
-        self.diversity_index_history = deque(maxlen=max_history)
-        
-        self.birth_rate_history = deque(maxlen=max_history)
-        self.death_rate_history = deque(maxlen=max_history)
-        self.stability_index_history = deque(maxlen=max_history)
-        self.fractal_dimension_history = deque(maxlen=max_history)
+        self.population_history = PopulationMatrix(max_history)
+
+        self.entropy_history = RingBuffer(max_history)
+        self.energy_history = RingBuffer(max_history)
+        self.diversity_index_history = RingBuffer(max_history)
+
+        self.birth_rate_history = RingBuffer(max_history)
+        self.death_rate_history = RingBuffer(max_history)
+        self.stability_index_history = RingBuffer(max_history)
+        self.fractal_dimension_history = RingBuffer(max_history)
         
         self.prev_population = {cell_type: 0 for cell_type in CellType if cell_type != CellType.EMPTY}
         self.prev_total_population = 0
+        self._last_counts = np.zeros(5, dtype=np.int64)
         
         self.analysis_window = 50
         self.update_frequency = 1
 
-    def update(self):
-        if self.game.generation % self.update_frequency == 0:
-            self._calculate_basic_stats()
-            self._calculate_derived_stats()
-            self._calculate_advanced_stats()
+        # Rolling sum / sum-of-squares over the stability window so the
+        # variance update is O(1) per generation
+        self._win_buf = deque(maxlen=self.analysis_window)
+        self._win_sum = 0.0
+        self._win_sqsum = 0.0
 
-    def _calculate_basic_stats(self):
-        counts = self.game.get_population_counts()
-        
-        for cell_type in self.population_history.keys():
-            self.population_history[cell_type].append(counts[cell_type])
-        
-        total_pop = sum(counts[cell_type] for cell_type in self.population_history.keys())
-        self.total_population_history.append(total_pop)
-        
-        entropy = self.game.calculate_entropy()
-        self.entropy_history.append(entropy)
-        
-        self.energy_history.append(self.game.total_energy)
+        # Query results are stable within a generation; cache them until
+        # the next update
+        self._query_cache = {}
+        self._grid_hash = None
+        self._last_generation = 0
 
-    def _calculate_derived_stats(self):
-        counts = self.game.get_population_counts()
-        total = sum(counts[cell_type] for cell_type in self.population_history.keys())
-        
-        if total > 0:
-            diversity = 0.0
-            for cell_type in self.population_history.keys():
-                if counts[cell_type] > 0:
-                    p = counts[cell_type] / total
-                    diversity -= p * math.log(p)
-            self.diversity_index_history.append(diversity)
+    def snapshot(self) -> StatsSnapshot:
+        # Called on the simulation thread right after a step; copies the
+        # arrays so later engine steps cannot mutate what update() reads
+        return StatsSnapshot(
+            generation=self.game.generation,
+            grid_hash=hash(self.game.cell_type.tobytes()),
+            counts=self.game.get_population_counts_vec().copy(),
+            total_energy=float(self.game.total_energy),
+            entropy=self.game.calculate_entropy(),
+            last_births=int(self.game.last_births),
+            last_deaths=int(self.game.last_deaths),
+            alive_mask=self.game.get_alive_mask().copy(),
+        )
+
+    def update(self, snapshot: Optional[StatsSnapshot] = None):
+        if snapshot is None:
+            snapshot = self.snapshot()
+        if snapshot.generation % self.update_frequency == 0:
+            # A frozen grid produces the exact same metrics, so skip the
+            # entropy and box-counting passes and repeat the last row
+            if snapshot.grid_hash == self._grid_hash and len(self.population_history):
+                self._repeat_last(snapshot)
+            else:
+                self._grid_hash = snapshot.grid_hash
+                self._calculate_stats(snapshot)
+                self._calculate_advanced_stats(snapshot)
+            self._last_generation = snapshot.generation
+            self._query_cache.clear()
+
+    def _repeat_last(self, snapshot: StatsSnapshot):
+        last = self.population_history.last_column()
+        total = int(last.sum())
+        self.population_history.append(last)
+
+        self.entropy_history.append(self.entropy_history[-1])
+        # Energy still decays on a frozen grid; the engine keeps the
+        # total current, so read it rather than repeating a stale value
+        self.energy_history.append(snapshot.total_energy)
+        self.diversity_index_history.append(self.diversity_index_history[-1])
+
+        # An unchanged grid means zero turnover, matching what the full
+        # recompute would produce
+        self.birth_rate_history.append(0)
+        self.death_rate_history.append(0)
+
+        self._push_stability(total)
+        self.fractal_dimension_history.append(self.fractal_dimension_history[-1])
+
+    def _calculate_stats(self, snapshot: StatsSnapshot):
+        # One bincount read feeds the raw histories and the derived
+        # diversity and birth/death rates
+        counts = snapshot.counts
+        self._last_counts = counts
+
+        self.population_history.append(counts[1:5])
+        total_pop = int(counts[1:5].sum())
+
+        self.entropy_history.append(snapshot.entropy)
+        self.energy_history.append(snapshot.total_energy)
+
+        if total_pop > 0:
+            p = counts[1:5] / total_pop
+            p = p[p > 0]
+            self.diversity_index_history.append(float(-(p * np.log(p)).sum()))
         else:
             self.diversity_index_history.append(0.0)
-        
-        current_total = self.total_population_history[-1] if self.total_population_history else 0
-        birth_rate = max(0, current_total - self.prev_total_population)
-        death_rate = max(0, self.prev_total_population - current_total)
-        
-        self.birth_rate_history.append(birth_rate)
-        self.death_rate_history.append(death_rate)
-        
-        self.prev_total_population = current_total
-        for cell_type in self.population_history.keys():
-            self.prev_population[cell_type] = self.population_history[cell_type][-1] if self.population_history[cell_type] else 0
-
-    def _calculate_advanced_stats(self):
-        if len(self.total_population_history) >= self.analysis_window:
-            recent_populations = list(self.total_population_history)[-self.analysis_window:]
-            variance = np.var(recent_populations)
-            stability = 1.0 / (1.0 + variance) if variance >= 0 else 0.0
-            self.stability_index_history.append(stability)
+
+        # Exact turnover from the engine's grid-step delta; the old
+        # total-difference estimate hid simultaneous births and deaths
+        self.birth_rate_history.append(snapshot.last_births)
+        self.death_rate_history.append(snapshot.last_deaths)
+
+        self.prev_total_population = total_pop
+        for cell_type in self.prev_population.keys():
+            self.prev_population[cell_type] = int(counts[cell_type.value])
+
+    def _calculate_advanced_stats(self, snapshot: StatsSnapshot):
+        pops = self.population_history
+        new_val = float(pops.last_column().sum()) if len(pops) else 0.0
+        self._push_stability(new_val)
+
+        fractal_dim = self._estimate_fractal_dimension(snapshot.alive_mask)
+        self.fractal_dimension_history.append(fractal_dim)
+
+    def _push_stability(self, new_val: float):
+        if len(self._win_buf) == self.analysis_window:
+            old = self._win_buf[0]
+            self._win_sum -= old
+            self._win_sqsum -= old * old
+        self._win_buf.append(new_val)
+        self._win_sum += new_val
+        self._win_sqsum += new_val * new_val
+
+        if len(self._win_buf) == self.analysis_window:
+            mean = self._win_sum / self.analysis_window
+            variance = max(0.0, self._win_sqsum / self.analysis_window - mean * mean)
+            self.stability_index_history.append(1.0 / (1.0 + variance))
         else:
             self.stability_index_history.append(0.0)
-        
-        fractal_dim = self._estimate_fractal_dimension()
-        self.fractal_dimension_history.append(fractal_dim)
 
-    def _estimate_fractal_dimension(self) -> float:
+    def _estimate_fractal_dimension(self, alive: np.ndarray) -> float:
         scales = [1, 2, 4, 8]
         counts = []
-        
+
+        # Box counting as blocked any-reductions over the alive mask;
+        # partial boxes on the right/bottom edges are counted separately
+        height, width = alive.shape
+
         for scale in scales:
-            count = 0
-            for y in range(0, self.game.height, scale):
-                for x in range(0, self.game.width, scale):
-                    has_life = False
-                    for dy in range(min(scale, self.game.height - y)):
-                        for dx in range(min(scale, self.game.width - x)):
-                            if self.game.get_cell(x + dx, y + dy).cell_type != CellType.EMPTY:
-                                has_life = True
-                                break
-                        if has_life:
-                            break
-                    if has_life:
-                        count += 1
+            if scale == 1:
+                counts.append(int(np.count_nonzero(alive)))
+                continue
+
+            full_h = (height // scale) * scale
+            full_w = (width // scale) * scale
+            blocks = alive[:full_h, :full_w].reshape(
+                full_h // scale, scale, full_w // scale, scale)
+            count = int(blocks.any(axis=(1, 3)).sum())
+
+            if full_w < width:
+                count += int(alive[:full_h, full_w:].reshape(
+                    full_h // scale, -1).any(axis=1).sum())
+            if full_h < height:
+                count += int(alive[full_h:, :full_w].reshape(
+                    -1, full_w // scale, scale).any(axis=(0, 2)).sum())
+            if full_w < width and full_h < height:
+                count += int(alive[full_h:, full_w:].any())
+
             counts.append(count)
         
         if len(counts) >= 2 and all(c > 0 for c in counts):
-            log_scales = [math.log(1.0/s) for s in scales]
-            log_counts = [math.log(c) for c in counts]
-            
-            n = len(log_scales)
-            sum_x = sum(log_scales)
-            sum_y = sum(log_counts)
-            sum_xy = sum(x*y for x, y in zip(log_scales, log_counts))
-            sum_x2 = sum(x*x for x in log_scales)
-            
-            if n * sum_x2 - sum_x * sum_x != 0:
-                slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-                return max(0.0, min(2.0, slope))
-        
+            log_counts = np.log(np.array(counts, dtype=np.float64))
+            slope = _linreg_slope(_LOG_SCALES, log_counts)
+            return max(0.0, min(2.0, slope))
+
         return 1.0
 
     def get_current_stats(self) -> Dict:
-        if not self.total_population_history:
+        if not len(self.population_history):
             return {}
-        
-        return {
-            'generation': self.game.generation,
-            'total_population': self.total_population_history[-1],
+
+        cached = self._query_cache.get('current_stats')
+        if cached is not None and cached[0] == self._last_generation:
+            return cached[1]
+
+        last = self.population_history.last_column()
+        stats = {
+            'generation': self._last_generation,
+            'total_population': int(last.sum()),
             'populations': {
-                'red': self.population_history[CellType.RED][-1] if self.population_history[CellType.RED] else 0,
-                'green': self.population_history[CellType.GREEN][-1] if self.population_history[CellType.GREEN] else 0,
-                'blue': self.population_history[CellType.BLUE][-1] if self.population_history[CellType.BLUE] else 0,
-                'quantum': self.population_history[CellType.QUANTUM][-1] if self.population_history[CellType.QUANTUM] else 0
+                'red': int(last[0]),
+                'green': int(last[1]),
+                'blue': int(last[2]),
+                'quantum': int(last[3])
             },
             'entropy': self.entropy_history[-1] if self.entropy_history else 0,
             'energy': self.energy_history[-1] if self.energy_history else 0,
             'diversity_index': self.diversity_index_history[-1] if self.diversity_index_history else 0,
-            'birth_rate': self.birth_rate_history[-1] if self.birth_rate_history else 0,
-            'death_rate': self.death_rate_history[-1] if self.death_rate_history else 0,
+            'birth_rate': int(self.birth_rate_history[-1]) if self.birth_rate_history else 0,
+            'death_rate': int(self.death_rate_history[-1]) if self.death_rate_history else 0,
             'stability_index': self.stability_index_history[-1] if self.stability_index_history else 0,
             'fractal_dimension': self.fractal_dimension_history[-1] if self.fractal_dimension_history else 0
         }
+        self._query_cache['current_stats'] = (self._last_generation, stats)
+        return stats
+
+    @staticmethod
+    def _tail(data, window: int) -> np.ndarray:
+        # Last `window` samples of a RingBuffer or plain array
+        if isinstance(data, RingBuffer):
+            return data.recent(window)
+        arr = np.asarray(data, dtype=np.float64)
+        return arr if window is None or window >= arr.shape[0] else arr[-window:]
 
-    def get_moving_average(self, data: deque, window: int = None) -> float:
-        if not data:
+    def get_moving_average(self, data, window: int = None) -> float:
+        if not len(data):
             return 0.0
         if window is None:
             window = self.analysis_window
-        
-        recent_data = list(data)[-window:]
-        return sum(recent_data) / len(recent_data) if recent_data else 0.0
 
-    def get_trend(self, data: deque, window: int = None) -> float:
-        if not data:
+        return float(self._tail(data, window).mean())
+
+    def get_trend(self, data, window: int = None) -> float:
+        if not len(data):
             return 0.0
         if window is None:
-            window = min(self.analysis_window, len(data))
-        
+            window = self.analysis_window
+        window = min(window, len(data))
+
         if window < 2:
             return 0.0
-        
-        recent_data = list(data)[-window:]
-        x = list(range(len(recent_data)))
-        y = recent_data
-        
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-        sum_x2 = sum(xi * xi for xi in x)
-        
-        if n * sum_x2 - sum_x * sum_x != 0:
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-            return slope
-        return 0.0
+
+        y = np.ascontiguousarray(self._tail(data, window), dtype=np.float64)
+        return float(_linreg_slope(np.arange(window, dtype=np.float64), y))
 
     def get_analysis_summary(self) -> Dict:
-        if not self.total_population_history:
+        if not len(self.population_history):
             return {'error': 'No data available'}
-        
+
+        cached = self._query_cache.get('analysis_summary')
+        if cached is not None and cached[0] == self.game.generation:
+            return cached[1]
+
         summary = {
             'population_trends': {},
             'system_health': {},
             'complexity_measures': {}
         }
-        
-        for cell_type in self.population_history.keys():
-            data = self.population_history[cell_type]
-            if data:
-                summary['population_trends'][cell_type.name.lower()] = {
-                    'current': data[-1],
-                    'average': self.get_moving_average(data),
-                    'trend': self.get_trend(data),
-                    'peak': max(data),
-                    'min': min(data)
-                }
-        
+
+        for row, name in enumerate(('red', 'green', 'blue', 'quantum')):
+            data = self.population_history.species(row)
+            summary['population_trends'][name] = {
+                'current': int(data[-1]),
+                'average': self.get_moving_average(data),
+                'trend': self.get_trend(data),
+                'peak': int(data.max()),
+                'min': int(data.min())
+            }
+
+        total = int(self.population_history.last_column().sum())
         summary['system_health'] = {
             'stability': self.get_moving_average(self.stability_index_history),
             'diversity': self.get_moving_average(self.diversity_index_history),
-            'energy_efficiency': self.energy_history[-1] / max(1, self.total_population_history[-1]) if self.energy_history and self.total_population_history else 0,
+            'energy_efficiency': self.energy_history[-1] / max(1, total) if self.energy_history else 0,
             'birth_death_ratio': self.birth_rate_history[-1] / max(1, self.death_rate_history[-1]) if self.birth_rate_history and self.death_rate_history else 1
         }
         
@@ -215,16 +425,21 @@ class StatisticsTracker:
             'fractal_dimension': self.get_moving_average(self.fractal_dimension_history),
             'entropy_trend': self.get_trend(self.entropy_history)
         }
-        
+
+        self._query_cache['analysis_summary'] = (self.game.generation, summary)
         return summary
 
     def detect_patterns(self) -> List[str]:
         patterns = []
-        
-        if len(self.total_population_history) < 20:
+
+        if len(self.population_history) < 20:
             return patterns
-        
-        recent_populations = list(self.total_population_history)[-20:]
+
+        cached = self._query_cache.get('detect_patterns')
+        if cached is not None and cached[0] == self.game.generation:
+            return cached[1]
+
+        recent_populations = self.population_history.totals(20)
         
         if self._detect_oscillation(recent_populations):
             patterns.append("Population oscillation detected")
@@ -240,29 +455,16 @@ class StatisticsTracker:
         
         if self._detect_chaos():
             patterns.append("Chaotic dynamics detected")
-        
+
+        self._query_cache['detect_patterns'] = (self.game.generation, patterns)
         return patterns
 
-    def _detect_oscillation(self, data: List[float]) -> bool:
+    def _detect_oscillation(self, data) -> bool:
         if len(data) < 6:
             return False
-        
-        peaks = []
-        valleys = []
-        
-        for i in range(1, len(data) - 1):
-            if data[i] > data[i-1] and data[i] > data[i+1]:
-                peaks.append(i)
-            elif data[i] < data[i-1] and data[i] < data[i+1]:
-                valleys.append(i)
-        
-        if len(peaks) >= 3:
-            intervals = [peaks[i+1] - peaks[i] for i in range(len(peaks)-1)]
-            avg_interval = sum(intervals) / len(intervals)
-            variance = sum((interval - avg_interval) ** 2 for interval in intervals) / len(intervals)
-            return variance < avg_interval * 0.1
-        
-        return False
+
+        peaks, mean, variance = _osc_stats(np.ascontiguousarray(data, dtype=np.float64))
+        return peaks >= 3 and variance < mean * 0.1
 
     def _detect_exponential_growth(self, data: List[float]) -> bool:
         if len(data) < 5:
@@ -281,76 +483,78 @@ class StatisticsTracker:
         return False
 
     def _detect_extinction_risk(self) -> bool:
-        for cell_type in self.population_history.keys():
-            if self.population_history[cell_type]:
-                current = self.population_history[cell_type][-1]
-                if current > 0 and current < 5:
-                    recent_trend = self.get_trend(self.population_history[cell_type], 10)
-                    if recent_trend < -0.1:
-                        return True
+        # Current counts come from the last bincount; the slope fit only
+        # runs for species already in the danger band
+        counts = self._last_counts
+        for row in range(4):
+            if 1 <= counts[row + 1] < 5:
+                recent_trend = self.get_trend(self.population_history.species(row), 10)
+                if recent_trend < -0.1:
+                    return True
         return False
 
-    def _detect_stability(self, data: List[float]) -> bool:
+    def _detect_stability(self, data) -> bool:
         if len(data) < 10:
             return False
-        
-        mean_pop = sum(data) / len(data)
-        variance = sum((x - mean_pop) ** 2 for x in data) / len(data)
-        coefficient_of_variation = (variance ** 0.5) / mean_pop if mean_pop > 0 else float('inf')
-        
+
+        data = np.asarray(data, dtype=np.float64)
+        mean_pop = data.mean()
+        coefficient_of_variation = (data.var() ** 0.5) / mean_pop if mean_pop > 0 else float('inf')
+
         return coefficient_of_variation < 0.05
 
     def _detect_chaos(self) -> bool:
         if len(self.entropy_history) < 20:
             return False
         
-        recent_entropy = list(self.entropy_history)[-20:]
-        entropy_variance = np.var(recent_entropy) if recent_entropy else 0
+        recent_entropy = self.entropy_history.recent(20)
+        entropy_variance = recent_entropy.var() if recent_entropy.size else 0
         fractal_dim = self.fractal_dimension_history[-1] if self.fractal_dimension_history else 1
         
         return entropy_variance > 0.5 and fractal_dim > 1.5
 
     def export_data(self, filename: str = "game_stats.csv"):
-        import csv
-        
-        with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['generation', 'total_pop', 'red', 'green', 'blue', 'quantum', 
-                         'entropy', 'energy', 'diversity', 'birth_rate', 'death_rate', 
-                         'stability', 'fractal_dim']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            
-            max_len = max(len(self.total_population_history), 
-                         len(list(self.population_history.values())[0]),
-                         len(self.entropy_history))
-            
-            for i in range(max_len):
-                row = {
-                    'generation': i,
-                    'total_pop': self.total_population_history[i] if i < len(self.total_population_history) else 0,
-                    'red': self.population_history[CellType.RED][i] if i < len(self.population_history[CellType.RED]) else 0,
-                    'green': self.population_history[CellType.GREEN][i] if i < len(self.population_history[CellType.GREEN]) else 0,
-                    'blue': self.population_history[CellType.BLUE][i] if i < len(self.population_history[CellType.BLUE]) else 0,
-                    'quantum': self.population_history[CellType.QUANTUM][i] if i < len(self.population_history[CellType.QUANTUM]) else 0,
-                    'entropy': self.entropy_history[i] if i < len(self.entropy_history) else 0,
-                    'energy': self.energy_history[i] if i < len(self.energy_history) else 0,
-                    'diversity': self.diversity_index_history[i] if i < len(self.diversity_index_history) else 0,
-                    'birth_rate': self.birth_rate_history[i] if i < len(self.birth_rate_history) else 0,
-                    'death_rate': self.death_rate_history[i] if i < len(self.death_rate_history) else 0,
-                    'stability': self.stability_index_history[i] if i < len(self.stability_index_history) else 0,
-                    'fractal_dim': self.fractal_dimension_history[i] if i < len(self.fractal_dimension_history) else 0
-                }
-                writer.writerow(row)
+        fieldnames = ['generation', 'total_pop', 'red', 'green', 'blue', 'quantum',
+                     'entropy', 'energy', 'diversity', 'birth_rate', 'death_rate',
+                     'stability', 'fractal_dim']
+        pops = self.population_history
+        series = [
+            pops.totals().astype(np.float64),
+            pops.species(0), pops.species(1), pops.species(2), pops.species(3),
+            self.entropy_history.recent(),
+            self.energy_history.recent(),
+            self.diversity_index_history.recent(),
+            self.birth_rate_history.recent(),
+            self.death_rate_history.recent(),
+            self.stability_index_history.recent(),
+            self.fractal_dimension_history.recent()
+        ]
+        max_len = max(arr.shape[0] for arr in series)
+
+        # Shorter histories are zero-padded at the tail, matching the
+        # old per-row fallback
+        def padded(arr):
+            if arr.shape[0] < max_len:
+                arr = np.concatenate(
+                    [arr, np.zeros(max_len - arr.shape[0], dtype=arr.dtype)])
+            return arr
+
+        data = np.column_stack(
+            [np.arange(max_len, dtype=np.float64)] + [padded(arr) for arr in series])
+        np.savetxt(filename, data, delimiter=',',
+                   header=','.join(fieldnames), comments='', fmt='%.6g')
 
     def clear_history(self):
-        for history in self.population_history.values():
-            history.clear()
-        self.total_population_history.clear()
+        self.population_history.clear()
         self.entropy_history.clear()
         self.energy_history.clear()
         self.diversity_index_history.clear()
         self.birth_rate_history.clear()
         self.death_rate_history.clear()
         self.stability_index_history.clear()
-        self.fractal_dimension_history.clear()
\ No newline at end of file
+        self.fractal_dimension_history.clear()
+        self._win_buf.clear()
+        self._win_sum = 0.0
+        self._win_sqsum = 0.0
+        self._query_cache.clear()
+        self._grid_hash = None
\ No newline at end of file
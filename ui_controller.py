@@ -1,6 +1,8 @@
 import pygame
-import math
+import functools
+import numpy as np
 from typing import Optional, Tuple, Dict, List
+from collections import OrderedDict
 from game_core import GameOfLife, CellType
 from patterns import PatternLibrary
 from events import EventSystem, EventType
@@ -8,6 +10,64 @@ from stats import StatisticsTracker
 import json
 import os
 
+# Rendered text surfaces are cached per widget; glyph rasterization only
+# happens when the text, size or color actually changes
+_TEXT_CACHE_LIMIT = 8
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size: int) -> pygame.font.Font:
+    # One shared default-font face per size; Font(None, n) reopens and
+    # reparses the bundled TTF on every call
+    return pygame.font.Font(None, size)
+
+def _cached_text(cache, font, text, color):
+    key = (text, font.get_height(), color)
+    surf = cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color).convert_alpha()
+        if len(cache) >= _TEXT_CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
+        cache[key] = surf
+    return surf
+
+# Shared translucent effect surfaces; only a handful of widget sizes
+# exist at any panel width, so these never grow past a few entries
+_OVERLAY_CACHE: Dict[tuple, pygame.Surface] = {}
+_GLOW_CACHE: Dict[tuple, pygame.Surface] = {}
+_CHROME_CACHE: Dict[tuple, pygame.Surface] = {}
+
+def _button_chrome(width, height, bg_color, border_color, border_width=2):
+    # Pre-baked rounded fill + border; rounded-rect rasterization only
+    # runs the first time a (size, colors) combination appears
+    key = (width, height, bg_color, border_color, border_width)
+    surf = _CHROME_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(surf, bg_color, (0, 0, width, height), border_radius=5)
+        pygame.draw.rect(surf, border_color, (0, 0, width, height), border_width, border_radius=5)
+        surf = surf.convert_alpha()
+        _CHROME_CACHE[key] = surf
+    return surf
+
+def _hover_overlay(width, height):
+    surf = _OVERLAY_CACHE.get((width, height))
+    if surf is None:
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill((255, 255, 255, 20))
+        surf = surf.convert_alpha()
+        _OVERLAY_CACHE[(width, height)] = surf
+    return surf
+
+def _glow_surface(width, height, color):
+    key = (width, height, color)
+    surf = _GLOW_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (*color, 100), (0, 0, width, height), border_radius=5)
+        surf = surf.convert_alpha()
+        _GLOW_CACHE[key] = surf
+    return surf
+
 class FixedButton:
     def __init__(self, x, y, width, height, text, font, bg_color=(60, 60, 70), hover_color=(80, 80, 90), pressed_color=(100, 100, 110), text_color=(255, 255, 255)):
         self.rect = pygame.Rect(x, y, width, height)
@@ -21,33 +81,51 @@ class FixedButton:
         self.is_hovered = False
         self.enabled = True
         self.clicked = False
-        
+        self._text_cache = {}
+        self._update_bounds()
+
+    def _update_bounds(self):
+        # Plain-int AABB mirror of self.rect; the motion path compares
+        # these inline instead of crossing into Rect.collidepoint
+        self._x1, self._y1 = self.rect.x, self.rect.y
+        self._x2, self._y2 = self.rect.right, self.rect.bottom
+
     def handle_event(self, event):
         if not self.enabled:
             return False
-            
+
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                              pygame.MOUSEMOTION):
+            return False
+
+        x, y = event.pos
+        inside = self._x1 <= x < self._x2 and self._y1 <= y < self._y2
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
+            if inside:
                 self.is_pressed = True
                 return False
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if self.is_pressed and self.rect.collidepoint(event.pos):
+            if self.is_pressed and inside:
                 self.is_pressed = False
                 self.clicked = True
                 return True
             self.is_pressed = False
         elif event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-            
+            self.is_hovered = inside
+
         return False
-    
+
     def update_position(self, x, y, width=None, height=None):
-        if width is not None:
+        if width is not None and width != self.rect.width:
             self.rect.width = width
-        if height is not None:
+            self._text_cache.clear()
+        if height is not None and height != self.rect.height:
             self.rect.height = height
+            self._text_cache.clear()
         self.rect.x = x
         self.rect.y = y
+        self._update_bounds()
     
     def draw(self, screen):
         if not self.enabled:
@@ -63,23 +141,14 @@ class FixedButton:
             color = self.bg_color
             text_color = self.text_color
             
-        pygame.draw.rect(screen, color, self.rect, border_radius=5)
-        pygame.draw.rect(screen, (150, 150, 150), self.rect, 2, border_radius=5)
-        
+        screen.blit(_button_chrome(self.rect.width, self.rect.height, color, (150, 150, 150)),
+                    self.rect.topleft)
+
         if self.enabled and (self.is_hovered or self.is_pressed):
-            overlay = pygame.Surface((self.rect.width, self.rect.height // 2), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 20))
-            screen.blit(overlay, self.rect.topleft)
+            screen.blit(_hover_overlay(self.rect.width, self.rect.height // 2), self.rect.topleft)
         
         font_size = min(self.rect.height - 8, 20)
-        if hasattr(self, '_cached_font_size') and self._cached_font_size != font_size:
-            self._cached_font = pygame.font.Font(None, font_size)
-            self._cached_font_size = font_size
-        elif not hasattr(self, '_cached_font'):
-            self._cached_font = pygame.font.Font(None, font_size)
-            self._cached_font_size = font_size
-            
-        text_surface = self._cached_font.render(self.text, True, text_color)
+        text_surface = _cached_text(self._text_cache, _get_font(font_size), self.text, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -94,19 +163,33 @@ class FixedSlider:
         self.format_str = format_str
         self.dragging = False
         self.handle_radius = 10
-        
+        self._text_cache = {}
+        self._handle_rect = pygame.Rect(0, 0, 0, 0)
+        self._update_handle_rect()
+
     def update_position(self, x, y, width):
         self.rect.x = x
         self.rect.y = y
         self.rect.width = width
-        
-    def handle_event(self, event):
+        self._update_handle_rect()
+
+    def _update_handle_rect(self):
+        # Recomputed only when the value or geometry changes, so the
+        # mouse-motion path never allocates
         handle_x = self.rect.x + (self.value - self.min_val) / (self.max_val - self.min_val) * self.rect.width
-        handle_rect = pygame.Rect(handle_x - self.handle_radius, self.rect.centery - self.handle_radius, 
-                                self.handle_radius * 2, self.handle_radius * 2)
-        
+        self._handle_rect.update(handle_x - self.handle_radius,
+                                 self.rect.centery - self.handle_radius,
+                                 self.handle_radius * 2, self.handle_radius * 2)
+        self._x1, self._y1 = self.rect.x, self.rect.y
+        self._x2, self._y2 = self.rect.right, self.rect.bottom
+        self._hx1, self._hy1 = self._handle_rect.x, self._handle_rect.y
+        self._hx2, self._hy2 = self._handle_rect.right, self._handle_rect.bottom
+
+    def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if handle_rect.collidepoint(event.pos) or self.rect.collidepoint(event.pos):
+            x, y = event.pos
+            if (self._hx1 <= x < self._hx2 and self._hy1 <= y < self._hy2) or \
+                    (self._x1 <= x < self._x2 and self._y1 <= y < self._y2):
                 self.dragging = True
                 self.update_value(event.pos[0])
                 return True
@@ -118,12 +201,13 @@ class FixedSlider:
             self.update_value(event.pos[0])
             return True
         return False
-    
+
     def update_value(self, mouse_x):
         relative_x = mouse_x - self.rect.x
         relative_x = max(0, min(self.rect.width, relative_x))
         ratio = relative_x / self.rect.width
         self.value = self.min_val + ratio * (self.max_val - self.min_val)
+        self._update_handle_rect()
     
     def draw(self, screen):
         track_rect = pygame.Rect(self.rect.x, self.rect.centery - 3, self.rect.width, 6)
@@ -143,44 +227,97 @@ class FixedSlider:
         pygame.draw.circle(screen, (255, 255, 255), handle_center, self.handle_radius - 3)
         
         value_text = self.format_str.format(self.value)
-        small_font = pygame.font.Font(None, 16)
-        text_surface = small_font.render(value_text, True, (255, 255, 255))
+        text_surface = _cached_text(self._text_cache, _get_font(16), value_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(handle_x, self.rect.centery - 18))
         
         text_bg = pygame.Rect(text_rect.x - 3, text_rect.y - 1, text_rect.width + 6, text_rect.height + 2)
         pygame.draw.rect(screen, (0, 0, 0, 180), text_bg, border_radius=3)
         screen.blit(text_surface, text_rect)
 
+# UI species colors indexed by CellType value; tuple indexing skips the
+# enum hash in per-row render loops
+COLORS_BY_TYPE = (
+    (80, 80, 80),
+    (255, 100, 100),
+    (100, 255, 100),
+    (100, 100, 255),
+    (255, 255, 255),
+)
+
+_CELL_LABELS = {
+    CellType.RED: "Red",
+    CellType.GREEN: "Green",
+    CellType.BLUE: "Blue",
+    CellType.QUANTUM: "Quantum",
+    CellType.EMPTY: "Erase"
+}
+
+# display names for the events overlay, derived once instead of
+# re-titlecasing the enum values every frame
+_EVENT_NAMES = {event_type: event_type.value.replace('_', ' ').title()
+                for event_type in EventType}
+
+# 12x12 color swatches for the stats overlay species rows
+_SPECIES_SWATCHES = {}
+
+
+def _species_swatch(cell_type) -> pygame.Surface:
+    swatch = _SPECIES_SWATCHES.get(cell_type)
+    if swatch is None:
+        swatch = pygame.Surface((12, 12), pygame.SRCALPHA)
+        pygame.draw.rect(swatch, COLORS_BY_TYPE[cell_type.value],
+                         swatch.get_rect(), border_radius=2)
+        swatch = swatch.convert_alpha()
+        _SPECIES_SWATCHES[cell_type] = swatch
+    return swatch
+
 class FixedCellButton:
     def __init__(self, x, y, width, height, cell_type, font, colors):
         self.rect = pygame.Rect(x, y, width, height)
         self.cell_type = cell_type
         self.font = font
         self.colors = colors
+        self._my_cell_color = colors.get(cell_type, (255, 255, 255))
         self.is_pressed = False
         self.is_hovered = False
         self.is_selected = False
         self.clicked = False
-        
+        self._text_cache = {}
+        self._update_bounds()
+
+    def _update_bounds(self):
+        self._x1, self._y1 = self.rect.x, self.rect.y
+        self._x2, self._y2 = self.rect.right, self.rect.bottom
+
     def update_position(self, x, y, width, height):
         self.rect.x = x
         self.rect.y = y
+        if (width, height) != (self.rect.width, self.rect.height):
+            self._text_cache.clear()
         self.rect.width = width
         self.rect.height = height
-        
+        self._update_bounds()
+
     def handle_event(self, event):
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                              pygame.MOUSEMOTION):
+            return False
+
+        x, y = event.pos
+        inside = self._x1 <= x < self._x2 and self._y1 <= y < self._y2
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
+            if inside:
                 self.is_pressed = True
                 return False
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if self.is_pressed and self.rect.collidepoint(event.pos):
+            if self.is_pressed and inside:
                 self.is_pressed = False
                 self.clicked = True
                 return True
             self.is_pressed = False
         elif event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
+            self.is_hovered = inside
         return False
     
     def draw(self, screen):
@@ -201,8 +338,8 @@ class FixedCellButton:
             border_color = (120, 120, 120)
             border_width = 1
             
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=5)
-        pygame.draw.rect(screen, border_color, self.rect, border_width, border_radius=5)
+        screen.blit(_button_chrome(self.rect.width, self.rect.height, bg_color, border_color, border_width),
+                    self.rect.topleft)
         
         if self.cell_type != CellType.EMPTY:
             indicator_margin = max(3, self.rect.width // 10)
@@ -212,73 +349,74 @@ class FixedCellButton:
                 self.rect.width - indicator_margin * 2, 
                 max(10, self.rect.height - 25)
             )
-            cell_color = self.colors.get(self.cell_type, (255, 255, 255))
+            cell_color = self._my_cell_color
             pygame.draw.rect(screen, cell_color, color_rect, border_radius=3)
             
             if self.cell_type == CellType.QUANTUM:
-                glow_surface = pygame.Surface((color_rect.width + 4, color_rect.height + 4), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surface, (*cell_color, 100), (0, 0, color_rect.width + 4, color_rect.height + 4), border_radius=5)
+                glow_surface = _glow_surface(color_rect.width + 4, color_rect.height + 4, cell_color)
                 screen.blit(glow_surface, (color_rect.x - 2, color_rect.y - 2), special_flags=pygame.BLEND_ADD)
         
-        label_text = {
-            CellType.RED: "Red",
-            CellType.GREEN: "Green", 
-            CellType.BLUE: "Blue",
-            CellType.QUANTUM: "Quantum",
-            CellType.EMPTY: "Erase"
-        }.get(self.cell_type, "?")
+        label_text = _CELL_LABELS.get(self.cell_type, "?")
         
         font_size = min(14, max(10, self.rect.width // 6))
-        small_font = pygame.font.Font(None, font_size)
-        text_surface = small_font.render(label_text, True, (255, 255, 255))
+        text_surface = _cached_text(self._text_cache, _get_font(font_size), label_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(self.rect.centerx, self.rect.bottom - 8))
         screen.blit(text_surface, text_rect)
 
+# MiniMap colors indexed by CellType value
+_MINIMAP_PALETTE = np.array([
+    [0, 0, 0],
+    [255, 100, 100],
+    [100, 255, 100],
+    [100, 100, 255],
+    [255, 255, 255]
+], dtype=np.uint8)
+
 class MiniMap:
     def __init__(self, x, y, width, height, game):
         self.rect = pygame.Rect(x, y, width, height)
         self.game = game
-        self.surface = pygame.Surface((width, height))
-        
+        self.surface = pygame.Surface((width, height)).convert()
+        self._last_generation = -1
+        self._last_pop_hash = None
+        self._last_size = (width, height)
+
     def update_position(self, x, y, width, height):
         self.rect.x = x
         self.rect.y = y
-        self.rect.width = width
-        self.rect.height = height
-        self.surface = pygame.Surface((width, height))
-        
+        if (width, height) != (self.rect.width, self.rect.height):
+            self.rect.width = width
+            self.rect.height = height
+            self.surface = pygame.Surface((width, height)).convert()
+            self._last_generation = -1
+
     def update(self):
-        self.surface.fill((0, 0, 0))
-        
         if self.rect.width <= 0 or self.rect.height <= 0:
             return
-            
-        x_scale = self.rect.width / self.game.width
-        y_scale = self.rect.height / self.game.height
-        
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                cell = self.game.get_cell(x, y)
-                if cell and cell.cell_type != CellType.EMPTY:
-                    color = {
-                        CellType.RED: (255, 100, 100),
-                        CellType.GREEN: (100, 255, 100),
-                        CellType.BLUE: (100, 100, 255),
-                        CellType.QUANTUM: (255, 255, 255)
-                    }.get(cell.cell_type, (128, 128, 128))
-                    
-                    pixel_x = int(x * x_scale)
-                    pixel_y = int(y * y_scale)
-                    
-                    if 0 <= pixel_x < self.rect.width and 0 <= pixel_y < self.rect.height:
-                        pixel_size = max(1, int(min(x_scale, y_scale)))
-                        for dx in range(pixel_size):
-                            for dy in range(pixel_size):
-                                px, py = pixel_x + dx, pixel_y + dy
-                                if 0 <= px < self.rect.width and 0 <= py < self.rect.height:
-                                    self.surface.set_at((px, py), color)
-    
+
+        # Rebuild only when the simulation advanced, the user painted
+        # (population counts changed) or the widget was resized
+        pop_hash = self.game.get_population_counts_vec().tobytes()
+        size = (self.rect.width, self.rect.height)
+        if (self.game.generation == self._last_generation
+                and pop_hash == self._last_pop_hash
+                and size == self._last_size):
+            return
+
+        # One palette lookup over the whole grid, then a single scale;
+        # surfarray expects (W, H) ordering
+        rgb = _MINIMAP_PALETTE[self.game.cell_type]
+        tiny = pygame.surfarray.make_surface(rgb.swapaxes(0, 1)).convert()
+        self.surface = pygame.transform.scale(tiny, size)
+
+        self._last_generation = self.game.generation
+        self._last_pop_hash = pop_hash
+        self._last_size = size
+
     def draw(self, screen):
+        # Lazy: callers can blit every frame, the rebuild only happens
+        # when something changed
+        self.update()
         screen.blit(self.surface, self.rect.topleft)
         pygame.draw.rect(screen, (100, 100, 100), self.rect, 2)
 
@@ -295,17 +433,34 @@ class UIController:
         calculated_width = int(screen_width * self.panel_width_ratio)
         self.panel_width = max(self.min_panel_width, min(self.max_panel_width, calculated_width))
         self.panel_rect = pygame.Rect(screen_width - self.panel_width, 0, self.panel_width, screen_height)
-        
+        self._build_panel_bg()
+
         base_font_size = max(16, min(22, screen_height // 35))
         pygame.font.init()
-        self.title_font = pygame.font.Font(None, base_font_size + 4)
-        self.font = pygame.font.Font(None, base_font_size)
-        self.small_font = pygame.font.Font(None, base_font_size - 2)
+        self.title_font = _get_font(base_font_size + 4)
+        self.font = _get_font(base_font_size)
+        self.small_font = _get_font(base_font_size - 2)
+
+        # Static label surfaces; the fonts never change after init so
+        # these render exactly once (converted on first draw, since the
+        # controller may be built before the display)
+        self._static_labels = {
+            'title': self.title_font.render("Quantum Life", True, (255, 255, 255)),
+            'speed': self.small_font.render("Speed", True, (200, 200, 200)),
+            'brush': self.small_font.render("Brush Size", True, (200, 200, 200)),
+            'cell_types': self.small_font.render("Cell Types", True, (200, 200, 200)),
+            'display': self.small_font.render("Display", True, (200, 200, 200)),
+            'file': self.small_font.render("Save/Load", True, (200, 200, 200)),
+            'game_info': self.small_font.render("Game Info", True, (200, 200, 200)),
+            'sel_pattern': self.small_font.render("Selected Pattern:", True, (200, 200, 200)),
+            'place_hint': self.small_font.render("Right-click to place", True, (150, 150, 150)),
+        }
         
         self.show_ui = True
         self.current_cell_type = CellType.RED
         self.drawing_mode = True
         self.brush_size = 1
+        self._brush_offsets = {}
         self.show_stats = False
         self.show_patterns = False
         self.show_events = False
@@ -319,19 +474,28 @@ class UIController:
         self.pattern_library = PatternLibrary()
         self.selected_pattern = None
         
-        self.colors = {
-            CellType.RED: (255, 100, 100),
-            CellType.GREEN: (100, 255, 100),
-            CellType.BLUE: (100, 100, 255),
-            CellType.QUANTUM: (255, 255, 255),
-            CellType.EMPTY: (80, 80, 80)
-        }
+        self.colors = {cell_type: COLORS_BY_TYPE[cell_type.value] for cell_type in CellType}
         
         self.undo_stack = []
         self.redo_stack = []
         self.max_undo_steps = 20
         self.drawing_started = False
-        
+
+        # Widgets currently pressed or dragging; lets mouse-up and
+        # off-panel motion skip the widget dispatch loops entirely
+        self._pressed_widgets = set()
+        self._hover_active = False
+
+        self._status_key = None
+        self._status_surf = None
+        self._info_text_cache = {}
+        self._prev_total_gen = None
+        self._prev_total = 0
+
+        # Overlay text; LRU-capped since count/percentage strings churn
+        self._overlay_text_cache = OrderedDict()
+        self._overlay_static_cache = {}
+
         self._create_ui_elements()
 
     def _create_ui_elements(self):
@@ -411,15 +575,71 @@ class UIController:
             'load': FixedButton(x + file_width + 8, file_y, file_width, button_height, 'Load', self.font),
         }
 
+        # Layout anchors used every panel render; positions only change
+        # when the elements are rebuilt
+        self._file_buttons_bottom = max(button.rect.bottom for button in self.file_buttons.values())
+        self._first_cell_button_y = cell_y
+        self._first_toggle_y = toggle_y
+        self._first_file_y = file_y
+
+    def _build_panel_bg(self):
+        # The panel fill only changes size on resize; rebuilding it per
+        # frame was several MB of alloc + fill traffic
+        self._panel_bg_surface = pygame.Surface((self.panel_width, self.screen_height), pygame.SRCALPHA)
+        self._panel_bg_surface.fill((25, 25, 35, 240))
+        self._panel_composite = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self._panel_sig = None
+        # convert_alpha needs a live display; the controller is built
+        # before set_mode, so conversion waits for the first draw
+        self._display_ready = False
+        self._convert_static_surfaces()
+
+    def _convert_static_surfaces(self):
+        if pygame.display.get_surface() is None:
+            return
+        self._panel_bg_surface = self._panel_bg_surface.convert_alpha()
+        self._panel_composite = self._panel_composite.convert_alpha()
+        # not yet built when _build_panel_bg runs from __init__
+        labels = getattr(self, '_static_labels', None)
+        if labels is not None:
+            for key, surf in labels.items():
+                labels[key] = surf.convert_alpha()
+        self._display_ready = True
+
     def resize(self, new_width: int, new_height: int):
         self.screen_width = new_width
         self.screen_height = new_height
-        
+
         calculated_width = int(new_width * self.panel_width_ratio)
+        old_x, old_width = self.panel_rect.x, self.panel_width
         self.panel_width = max(self.min_panel_width, min(self.max_panel_width, calculated_width))
         self.panel_rect = pygame.Rect(new_width - self.panel_width, 0, self.panel_width, new_height)
-        
-        self._create_ui_elements()
+        self._build_panel_bg()
+
+        # Widget layout depends only on the panel's left edge and width;
+        # height-only resizes keep the existing elements
+        if (self.panel_rect.x, self.panel_width) != (old_x, old_width):
+            self._create_ui_elements()
+
+    def handle_events(self, events, event_system: EventSystem, stats: StatisticsTracker) -> bool:
+        # Batch dispatch with MOUSEMOTION coalescing: only the last
+        # position before the next button event matters for hover/drag,
+        # so motion floods from high-rate mice collapse to one dispatch
+        should_step = False
+        pending_motion = None
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                pending_motion = event
+                continue
+            if pending_motion is not None:
+                self.handle_event(pending_motion, event_system, stats)
+                pending_motion = None
+            if self.handle_event(event, event_system, stats):
+                should_step = True
+        if pending_motion is not None:
+            if self.handle_event(pending_motion, event_system, stats):
+                should_step = True
+        return should_step
 
     def handle_event(self, event, event_system: EventSystem, stats: StatisticsTracker):
         if not self.show_ui:
@@ -429,7 +649,30 @@ class UIController:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 self._handle_overlay_clicks(event, event_system)
             return False
-        
+
+        if event.type == pygame.KEYDOWN:
+            return self._handle_keyboard(event, event_system)
+
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                              pygame.MOUSEMOTION):
+            return False
+
+        if event.type == pygame.MOUSEMOTION:
+            # Off-panel motion only matters mid-drag; clear stale hover
+            # highlights once on the way out and skip the widget loops
+            if not self.panel_rect.collidepoint(event.pos) and not self._pressed_widgets:
+                if self._hover_active:
+                    for widget in self._iter_widgets():
+                        widget.is_hovered = False
+                    self._hover_active = False
+                return False
+            self._hover_active = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if not self._pressed_widgets:
+                return False
+            # Clear before dispatch: click handlers below may return early
+            self._pressed_widgets.clear()
+
         for name, button in self.buttons.items():
             if button.handle_event(event):
                 return self._handle_button_click(name, event_system, stats)
@@ -461,12 +704,20 @@ class UIController:
                     self.save_state()
                 elif name == 'load':
                     self.load_state()
-        
-        if event.type == pygame.KEYDOWN:
-            return self._handle_keyboard(event, event_system)
-        
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self._pressed_widgets = {w for w in self._iter_widgets() if w.is_pressed}
+            self._pressed_widgets.update(
+                s for s in self.sliders.values() if s.dragging)
+
         return False
 
+    def _iter_widgets(self):
+        yield from self.buttons.values()
+        yield from self.cell_buttons.values()
+        yield from self.toggle_buttons.values()
+        yield from self.file_buttons.values()
+
     def _handle_overlay_clicks(self, event, event_system):
         mouse_pos = event.pos
         
@@ -597,39 +848,31 @@ class UIController:
         
         return False
 
+    def _snapshot_grid(self):
+        return (self.game.cell_type.copy(), self.game.energy.copy(),
+                self.game.age.copy(), self.game.mutation_rate.copy(),
+                self.game.quantum_phase.copy())
+
+    def _restore_grid(self, state):
+        (self.game.cell_type, self.game.energy, self.game.age,
+         self.game.mutation_rate, self.game.quantum_phase) = state
+        self.game.mark_grid_dirty()
+
     def _save_state_for_undo(self):
-        import copy
-        state = copy.deepcopy(self.game.grid)
-        self.undo_stack.append(state)
+        self.undo_stack.append(self._snapshot_grid())
         if len(self.undo_stack) > self.max_undo_steps:
             self.undo_stack.pop(0)
         self.redo_stack.clear()
 
     def _undo_action(self):
         if self.undo_stack:
-            import copy
-            current_state = copy.deepcopy(self.game.grid)
-            self.redo_stack.append(current_state)
-            
-            previous_state = self.undo_stack.pop()
-            self.game.grid = previous_state
-            
-            for y in range(self.game.height):
-                for x in range(self.game.width):
-                    self.game.next_grid[y, x] = copy.deepcopy(self.game.grid[y, x])
+            self.redo_stack.append(self._snapshot_grid())
+            self._restore_grid(self.undo_stack.pop())
 
     def _redo_action(self):
         if self.redo_stack:
-            import copy
-            current_state = copy.deepcopy(self.game.grid)
-            self.undo_stack.append(current_state)
-            
-            next_state = self.redo_stack.pop()
-            self.game.grid = next_state
-            
-            for y in range(self.game.height):
-                for x in range(self.game.width):
-                    self.game.next_grid[y, x] = copy.deepcopy(self.game.grid[y, x])
+            self.undo_stack.append(self._snapshot_grid())
+            self._restore_grid(self.redo_stack.pop())
 
     def handle_mouse_input(self, mouse_pos: Tuple[int, int], mouse_buttons: Tuple[bool, bool, bool], visualizer):
         if self.show_stats or self.show_patterns or self.show_events:
@@ -647,20 +890,78 @@ class UIController:
             self.drawing_started = True
         
         grid_x, grid_y = visualizer.world_to_grid(mouse_pos[0], mouse_pos[1])
-        
-        for dy in range(-self.brush_size + 1, self.brush_size):
-            for dx in range(-self.brush_size + 1, self.brush_size):
-                target_x = grid_x + dx
-                target_y = grid_y + dy
-                
-                if (0 <= target_x < self.game.width and 0 <= target_y < self.game.height):
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance < self.brush_size:
-                        if self.current_cell_type == CellType.EMPTY:
-                            self.game.set_cell(target_x, target_y, CellType.EMPTY)
-                        else:
-                            energy = 1.0 + (self.brush_size - distance) * 0.2
-                            self.game.set_cell(target_x, target_y, self.current_cell_type, energy)
+        self._paint_brush(grid_x, grid_y)
+
+    def paint_line(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int], visualizer):
+        # Stamp the brush along every grid cell between two mouse samples
+        # so fast drags leave a continuous stroke
+        if self.show_stats or self.show_patterns or self.show_events:
+            return
+
+        if not self.drawing_mode:
+            self.drawing_started = False
+            return
+
+        if end_pos[0] >= self.screen_width - self.panel_width:
+            return
+
+        if not self.drawing_started:
+            self._save_state_for_undo()
+            self.drawing_started = True
+
+        x0, y0 = visualizer.world_to_grid(start_pos[0], start_pos[1])
+        x1, y1 = visualizer.world_to_grid(end_pos[0], end_pos[1])
+        for grid_x, grid_y in self._line_cells(x0, y0, x1, y1):
+            self._paint_brush(grid_x, grid_y)
+
+    @staticmethod
+    def _line_cells(x0: int, y0: int, x1: int, y1: int):
+        # Bresenham walk over the grid cells joining two points
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        step_x = 1 if x0 < x1 else -1
+        step_y = 1 if y0 < y1 else -1
+        error = dx + dy
+        while True:
+            yield x0, y0
+            if x0 == x1 and y0 == y1:
+                return
+            doubled = 2 * error
+            if doubled >= dy:
+                error += dy
+                x0 += step_x
+            if doubled <= dx:
+                error += dx
+                y0 += step_y
+
+    def _brush_kernel(self, size: int):
+        # Offsets and energies for a circular brush only depend on its
+        # size, so the sqrt grid is computed once per size
+        kernel = self._brush_offsets.get(size)
+        if kernel is None:
+            span = np.arange(-size + 1, size)
+            dx, dy = np.meshgrid(span, span)
+            d2 = dx * dx + dy * dy
+            inside = d2 < size * size
+            energies = (1.0 + (size - np.sqrt(d2[inside])) * 0.2).astype(np.float32)
+            kernel = (dx[inside], dy[inside], energies)
+            self._brush_offsets[size] = kernel
+        return kernel
+
+    def _paint_brush(self, grid_x: int, grid_y: int):
+        dx, dy, energies = self._brush_kernel(int(self.brush_size))
+        x = grid_x + dx
+        y = grid_y + dy
+        valid = (x >= 0) & (x < self.game.width) & (y >= 0) & (y < self.game.height)
+        if not valid.all():
+            x, y, energies = x[valid], y[valid], energies[valid]
+        if x.size == 0:
+            return
+        cell_types = np.full(x.size, self.current_cell_type.value, dtype=np.uint8)
+        if self.current_cell_type == CellType.EMPTY:
+            self.game.set_cells_bulk(x, y, cell_types)
+        else:
+            self.game.set_cells_bulk(x, y, cell_types, energies)
 
     def handle_pattern_placement(self, mouse_pos: Tuple[int, int], visualizer):
         if not self.selected_pattern or self.show_stats or self.show_patterns or self.show_events:
@@ -679,45 +980,77 @@ class UIController:
         pass
 
     def draw(self, screen):
+        if not self._display_ready:
+            self._convert_static_surfaces()
+
         if not self.show_ui:
             self._draw_minimal_status(screen)
             return
-        
-        panel_surface = pygame.Surface((self.panel_width, self.screen_height), pygame.SRCALPHA)
-        panel_surface.fill((25, 25, 35, 240))
-        screen.blit(panel_surface, (self.screen_width - self.panel_width, 0))
-        
+
+        # The panel composite is rebuilt only when its state signature
+        # changes; most paused/hover-idle frames are a single blit
+        sig = self._panel_signature()
+        if sig != self._panel_sig:
+            self._panel_sig = sig
+            self._render_panel(self._panel_composite)
+        screen.blit(self._panel_composite, self.panel_rect.topleft, self.panel_rect)
+
+        if self.show_stats:
+            self._draw_stats_overlay(screen)
+        if self.show_patterns:
+            self._draw_patterns_overlay(screen)
+        if self.show_events:
+            self._draw_events_overlay(screen)
+
+    def _panel_signature(self):
+        # Cheap tuple of everything the panel renders; compared per
+        # frame to decide whether the composite needs a rebuild
+        return (
+            self.game.generation,
+            self.game.get_population_counts_vec().tobytes(),
+            tuple((b.is_hovered, b.is_pressed, b.enabled, b.text)
+                  for b in self.buttons.values()),
+            tuple(s.value for s in self.sliders.values()),
+            tuple((b.is_hovered, b.is_pressed, getattr(b, 'is_selected', False))
+                  for b in self.cell_buttons.values()),
+            tuple((b.is_hovered, b.is_pressed)
+                  for b in self.toggle_buttons.values()),
+            tuple((b.is_hovered, b.is_pressed)
+                  for b in self.file_buttons.values()),
+            self.show_stats, self.show_patterns, self.show_events,
+            self.show_grid, self.show_energy, self.show_age,
+            self.selected_pattern,
+        )
+
+    def _render_panel(self, screen):
+        screen.fill((0, 0, 0, 0), self.panel_rect)
+        screen.blit(self._panel_bg_surface, (self.screen_width - self.panel_width, 0))
+
         pygame.draw.rect(screen, (80, 80, 100), self.panel_rect, 2)
-        
-        title_text = self.title_font.render("Quantum Life", True, (255, 255, 255))
-        screen.blit(title_text, (self.panel_rect.x + 10, 8))
-        
+
+        screen.blit(self._static_labels['title'], (self.panel_rect.x + 10, 8))
+
         for button in self.buttons.values():
             button.draw(screen)
-        
-        slider_labels = {"speed": "Speed", "brush": "Brush Size"}
+
         for name, slider in self.sliders.items():
-            label_y = slider.rect.y - 18
-            label_text = self.small_font.render(slider_labels[name], True, (200, 200, 200))
-            screen.blit(label_text, (slider.rect.x, label_y))
+            screen.blit(self._static_labels[name], (slider.rect.x, slider.rect.y - 18))
             slider.draw(screen)
-        
-        first_cell_button = list(self.cell_buttons.values())[0]
-        cell_title = self.small_font.render("Cell Types", True, (200, 200, 200))
-        screen.blit(cell_title, (self.panel_rect.x + 10, first_cell_button.rect.y - 18))
-        
+
+        screen.blit(self._static_labels['cell_types'],
+                    (self.panel_rect.x + 10, self._first_cell_button_y - 18))
+
         for button in self.cell_buttons.values():
             button.draw(screen)
-        
-        first_toggle = list(self.toggle_buttons.values())[0]
-        display_title = self.small_font.render("Display", True, (200, 200, 200))
-        screen.blit(display_title, (self.panel_rect.x + 10, first_toggle.rect.y - 18))
-        
+
+        screen.blit(self._static_labels['display'],
+                    (self.panel_rect.x + 10, self._first_toggle_y - 18))
+
         toggle_states = {
             'stats': self.show_stats, 'patterns': self.show_patterns, 'events': self.show_events,
             'grid': self.show_grid, 'energy': self.show_energy, 'age': self.show_age
         }
-        
+
         for name, button in self.toggle_buttons.items():
             if toggle_states.get(name, False):
                 button.bg_color = (70, 100, 140)
@@ -726,45 +1059,46 @@ class UIController:
                 button.bg_color = (60, 60, 70)
                 button.hover_color = (80, 80, 90)
             button.draw(screen)
-        
-        file_title = self.small_font.render("Save/Load", True, (200, 200, 200))
-        first_file = list(self.file_buttons.values())[0]
-        screen.blit(file_title, (self.panel_rect.x + 10, first_file.rect.y - 18))
-        
+
+        screen.blit(self._static_labels['file'],
+                    (self.panel_rect.x + 10, self._first_file_y - 18))
+
         for button in self.file_buttons.values():
             button.draw(screen)
-        
+
         self._draw_stats_info(screen)
-        
-        if self.show_stats:
-            self._draw_stats_overlay(screen)
-        if self.show_patterns:
-            self._draw_patterns_overlay(screen)
-        if self.show_events:
-            self._draw_events_overlay(screen)
 
     def _draw_minimal_status(self, screen):
-        status_text = f"Gen: {self.game.generation} | Pop: {sum(self.game.get_population_counts().values()) - self.game.get_population_counts()[CellType.EMPTY]} | Speed: {self.speed_multiplier:.1f}x | H to show UI"
-        text_surface = self.font.render(status_text, True, (255, 255, 255))
-        
+        # Re-render only when generation, population or speed changed;
+        # paused frames do no FreeType work for the HUD
+        counts = self.game.get_population_counts()
+        total_pop = sum(counts.values()) - counts[CellType.EMPTY]
+        key = (self.game.generation, total_pop, round(self.speed_multiplier, 1))
+        if key != self._status_key:
+            status_text = f"Gen: {key[0]} | Pop: {key[1]} | Speed: {key[2]:.1f}x | H to show UI"
+            self._status_surf = self.font.render(status_text, True, (255, 255, 255)).convert_alpha()
+            self._status_key = key
+        text_surface = self._status_surf
+
         text_bg = pygame.Rect(5, 5, text_surface.get_width() + 10, text_surface.get_height() + 6)
         pygame.draw.rect(screen, (0, 0, 0, 180), text_bg, border_radius=3)
         screen.blit(text_surface, (10, 8))
 
     def _draw_stats_info(self, screen):
-        file_buttons_bottom = max(button.rect.bottom for button in self.file_buttons.values())
-        stats_y = file_buttons_bottom + 25
-        
-        stats_title = self.small_font.render("Game Info", True, (200, 200, 200))
-        screen.blit(stats_title, (self.panel_rect.x + 12, stats_y))
+        stats_y = self._file_buttons_bottom + 25
+
+        screen.blit(self._static_labels['game_info'], (self.panel_rect.x + 12, stats_y))
         stats_y += 25
-        
-        gen_text = self.small_font.render(f"Generation: {self.game.generation}", True, (255, 255, 255))
+
+        gen_text = _cached_text(self._info_text_cache, self.small_font,
+                                f"Generation: {self.game.generation}", (255, 255, 255))
         screen.blit(gen_text, (self.panel_rect.x + 12, stats_y))
-        
+
         counts = self.game.get_population_counts()
-        total_pop = sum(count for cell_type, count in counts.items() if cell_type != CellType.EMPTY)
-        pop_text = self.small_font.render(f"Total Population: {total_pop}", True, (255, 255, 255))
+        total_pop = (counts[CellType.RED] + counts[CellType.GREEN]
+                     + counts[CellType.BLUE] + counts[CellType.QUANTUM])
+        pop_text = _cached_text(self._info_text_cache, self.small_font,
+                                f"Total Population: {total_pop}", (255, 255, 255))
         screen.blit(pop_text, (self.panel_rect.x + 12, stats_y + 18))
         
         species_y = stats_y + 45
@@ -773,8 +1107,8 @@ class UIController:
                 break
                 
             count = counts.get(cell_type, 0)
-            color = self.colors[cell_type]
-            
+            color = COLORS_BY_TYPE[cell_type.value]
+
             color_rect = pygame.Rect(self.panel_rect.x + 12, species_y + i * 18, 12, 12)
             pygame.draw.rect(screen, color, color_rect, border_radius=2)
             pygame.draw.rect(screen, (150, 150, 150), color_rect, 1, border_radius=2)
@@ -785,87 +1119,108 @@ class UIController:
         if self.selected_pattern:
             pattern_y = species_y + 90
             if pattern_y < self.panel_rect.bottom - 40:
-                pattern_title = self.small_font.render("Selected Pattern:", True, (200, 200, 200))
-                screen.blit(pattern_title, (self.panel_rect.x + 12, pattern_y))
+                screen.blit(self._static_labels['sel_pattern'], (self.panel_rect.x + 12, pattern_y))
                 pattern_text = self.small_font.render(self.selected_pattern, True, (255, 255, 100))
                 screen.blit(pattern_text, (self.panel_rect.x + 12, pattern_y + 16))
-                
-                instr_text = self.small_font.render("Right-click to place", True, (150, 150, 150))
-                screen.blit(instr_text, (self.panel_rect.x + 12, pattern_y + 32))
+
+                screen.blit(self._static_labels['place_hint'], (self.panel_rect.x + 12, pattern_y + 32))
+
+    _OVERLAY_TEXT_CACHE_LIMIT = 256
+
+    def _render_cached(self, font, text, color):
+        key = (id(font), text, color)
+        surf = self._overlay_text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            if len(self._overlay_text_cache) >= self._OVERLAY_TEXT_CACHE_LIMIT:
+                self._overlay_text_cache.popitem(last=False)
+            self._overlay_text_cache[key] = surf
+        else:
+            self._overlay_text_cache.move_to_end(key)
+        return surf
+
+    def _overlay_static(self, name, overlay_rect, title, labels=()):
+        # background, border, title and fixed labels never change for a
+        # given overlay size, so they are composed once and blitted whole
+        key = (name, overlay_rect.width, overlay_rect.height)
+        surf = self._overlay_static_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(overlay_rect.size, pygame.SRCALPHA)
+            surf.fill((20, 20, 30, 230))
+            pygame.draw.rect(surf, (100, 100, 120), surf.get_rect(), 2, border_radius=5)
+            surf.blit(self._render_cached(self.title_font, title, (255, 255, 255)), (10, 10))
+            for font, text, color, pos in labels:
+                surf.blit(self._render_cached(font, text, color), pos)
+            surf = surf.convert_alpha()
+            self._overlay_static_cache[key] = surf
+        return surf
 
     def _draw_stats_overlay(self, screen):
         overlay_width = min(450, self.screen_width - 100)
         overlay_rect = pygame.Rect(50, 50, overlay_width, 400)
-        
-        overlay_surface = pygame.Surface((overlay_rect.width, overlay_rect.height), pygame.SRCALPHA)
-        overlay_surface.fill((20, 20, 30, 230))
-        screen.blit(overlay_surface, overlay_rect.topleft)
-        
-        pygame.draw.rect(screen, (100, 100, 120), overlay_rect, 2, border_radius=5)
-        
-        title = self.title_font.render("Statistics", True, (255, 255, 255))
-        screen.blit(title, (overlay_rect.x + 10, overlay_rect.y + 10))
-        
+
+        static = self._overlay_static(
+            'stats', overlay_rect, "Statistics",
+            ((self.font, "Species Breakdown:", (200, 200, 200), (10, 125)),
+             (self.font, "Click anywhere to close", (180, 180, 180),
+              (10, overlay_rect.height - 30))))
+        screen.blit(static, overlay_rect.topleft)
+
         y_offset = 45
         counts = self.game.get_population_counts()
-        total_pop = sum(count for cell_type, count in counts.items() if cell_type != CellType.EMPTY)
-        
-        gen_text = self.font.render(f"Generation: {self.game.generation}", True, (255, 255, 255))
+        total_pop = (counts[CellType.RED] + counts[CellType.GREEN]
+                     + counts[CellType.BLUE] + counts[CellType.QUANTUM])
+
+        gen_text = self._render_cached(self.font, f"Generation: {self.game.generation}", (255, 255, 255))
         screen.blit(gen_text, (overlay_rect.x + 10, overlay_rect.y + y_offset))
         y_offset += 25
         
-        pop_text = self.font.render(f"Total Population: {total_pop:,}", True, (255, 255, 255))
+        pop_text = self._render_cached(self.font, f"Total Population: {total_pop:,}", (255, 255, 255))
         screen.blit(pop_text, (overlay_rect.x + 10, overlay_rect.y + y_offset))
         y_offset += 25
         
-        energy_text = self.font.render(f"Total Energy: {self.game.total_energy:.1f}", True, (255, 255, 255))
+        energy_text = self._render_cached(self.font, f"Total Energy: {self.game.total_energy:.1f}", (255, 255, 255))
         screen.blit(energy_text, (overlay_rect.x + 10, overlay_rect.y + y_offset))
-        y_offset += 30
-        
-        species_title = self.font.render("Species Breakdown:", True, (200, 200, 200))
-        screen.blit(species_title, (overlay_rect.x + 10, overlay_rect.y + y_offset))
-        y_offset += 25
+        y_offset += 55
         
+        species_blits = []
         for cell_type in [CellType.RED, CellType.GREEN, CellType.BLUE, CellType.QUANTUM]:
             count = counts.get(cell_type, 0)
             percentage = (count / total_pop * 100) if total_pop > 0 else 0
-            color = self.colors[cell_type]
-            
-            color_rect = pygame.Rect(overlay_rect.x + 15, overlay_rect.y + y_offset, 12, 12)
-            pygame.draw.rect(screen, color, color_rect, border_radius=2)
-            
-            text = self.small_font.render(f"{cell_type.name}: {count:,} ({percentage:.1f}%)", True, (255, 255, 255))
-            screen.blit(text, (overlay_rect.x + 35, overlay_rect.y + y_offset))
+
+            species_blits.append((_species_swatch(cell_type),
+                                  (overlay_rect.x + 15, overlay_rect.y + y_offset)))
+            text = self._render_cached(self.small_font, f"{cell_type.name}: {count:,} ({percentage:.1f}%)", (255, 255, 255))
+            species_blits.append((text, (overlay_rect.x + 35, overlay_rect.y + y_offset)))
             y_offset += 20
+        screen.blits(species_blits, doreturn=0)
         
         y_offset += 15
         entropy = self.game.calculate_entropy()
-        entropy_text = self.small_font.render(f"Entropy: {entropy:.3f}", True, (200, 200, 255))
+        entropy_text = self._render_cached(self.small_font, f"Entropy: {entropy:.3f}", (200, 200, 255))
         screen.blit(entropy_text, (overlay_rect.x + 10, overlay_rect.y + y_offset))
         y_offset += 18
         
-        if len(self.game.population_history[CellType.RED]) > 1:
-            prev_total = sum(self.game.population_history[cell_type][-2] for cell_type in [CellType.RED, CellType.GREEN, CellType.BLUE, CellType.QUANTUM])
+        if len(self.game.get_population_history(CellType.RED)) > 1:
+            # the previous-generation total only changes when a step runs,
+            # so recompute it once per generation rather than every frame
+            if self._prev_total_gen != self.game.generation:
+                self._prev_total = sum(
+                    int(self.game.get_population_history(cell_type)[-2])
+                    for cell_type in [CellType.RED, CellType.GREEN, CellType.BLUE, CellType.QUANTUM])
+                self._prev_total_gen = self.game.generation
+            prev_total = self._prev_total
             growth_rate = ((total_pop - prev_total) / prev_total * 100) if prev_total > 0 else 0
-            growth_text = self.small_font.render(f"Growth Rate: {growth_rate:+.1f}%", True, (255, 200, 200))
+            growth_text = self._render_cached(self.small_font, f"Growth Rate: {growth_rate:+.1f}%", (255, 200, 200))
             screen.blit(growth_text, (overlay_rect.x + 10, overlay_rect.y + y_offset))
-        
-        close_text = self.font.render("Click anywhere to close", True, (180, 180, 180))
-        screen.blit(close_text, (overlay_rect.x + 10, overlay_rect.bottom - 30))
 
     def _draw_patterns_overlay(self, screen):
         overlay_width = min(350, self.screen_width - 100)
         overlay_rect = pygame.Rect(50, 100, overlay_width, 300)
-        
-        overlay_surface = pygame.Surface((overlay_rect.width, overlay_rect.height), pygame.SRCALPHA)
-        overlay_surface.fill((20, 20, 30, 230))
-        screen.blit(overlay_surface, overlay_rect.topleft)
-        
-        pygame.draw.rect(screen, (100, 100, 120), overlay_rect, 2, border_radius=5)
-        
-        title = self.title_font.render("Pattern Library", True, (255, 255, 255))
-        screen.blit(title, (overlay_rect.x + 10, overlay_rect.y + 10))
-        
+
+        static = self._overlay_static('patterns', overlay_rect, "Pattern Library")
+        screen.blit(static, overlay_rect.topleft)
+
         pattern_categories = self.pattern_library.get_patterns_by_category()
         y_offset = 40
         
@@ -873,7 +1228,7 @@ class UIController:
             if y_offset > overlay_rect.height - 60:
                 break
                 
-            cat_text = self.font.render(f"▼ {category}", True, (200, 200, 100))
+            cat_text = self._render_cached(self.font, f"▼ {category}", (200, 200, 100))
             screen.blit(cat_text, (overlay_rect.x + 15, overlay_rect.y + y_offset))
             y_offset += 25
             
@@ -882,7 +1237,7 @@ class UIController:
                     break
                     
                 color = (255, 255, 100) if pattern == self.selected_pattern else (180, 180, 180)
-                pattern_text = self.small_font.render(f"  • {pattern}", True, color)
+                pattern_text = self._render_cached(self.small_font, f"  • {pattern}", color)
                 screen.blit(pattern_text, (overlay_rect.x + 25, overlay_rect.y + y_offset))
                 y_offset += 18
             
@@ -891,40 +1246,35 @@ class UIController:
     def _draw_events_overlay(self, screen):
         overlay_width = min(300, self.screen_width - 100)
         overlay_rect = pygame.Rect(50, 150, overlay_width, 280)
-        
-        overlay_surface = pygame.Surface((overlay_rect.width, overlay_rect.height), pygame.SRCALPHA)
-        overlay_surface.fill((20, 20, 30, 230))
-        screen.blit(overlay_surface, overlay_rect.topleft)
-        
-        pygame.draw.rect(screen, (100, 100, 120), overlay_rect, 2, border_radius=5)
-        
-        title = self.title_font.render("Events", True, (255, 255, 255))
-        screen.blit(title, (overlay_rect.x + 10, overlay_rect.y + 10))
-        
+
+        static = self._overlay_static(
+            'events', overlay_rect, "Events",
+            ((self.small_font, "Click event to trigger", (180, 180, 180),
+              (15, overlay_rect.height - 25)),))
+        screen.blit(static, overlay_rect.topleft)
+
         if not hasattr(self, 'event_buttons_rects'):
             self.event_buttons_rects = {}
         
+        mouse_pos = pygame.mouse.get_pos()
+
         event_types = list(EventType)[:7]
         for i, event_type in enumerate(event_types):
             button_rect = pygame.Rect(overlay_rect.x + 15, overlay_rect.y + 50 + i * 30, overlay_width - 30, 25)
             self.event_buttons_rects[event_type] = button_rect
-            
-            mouse_pos = pygame.mouse.get_pos()
+
             is_hovering = button_rect.collidepoint(mouse_pos)
-            
+
             button_color = (80, 80, 100) if is_hovering else (60, 60, 80)
             border_color = (150, 150, 170) if is_hovering else (120, 120, 140)
-            
+
             pygame.draw.rect(screen, button_color, button_rect, border_radius=3)
             pygame.draw.rect(screen, border_color, button_rect, 1, border_radius=3)
-            
-            event_name = event_type.value.replace('_', ' ').title()
-            text = self.small_font.render(event_name, True, (255, 255, 255))
+
+            text = self._render_cached(self.small_font, _EVENT_NAMES[event_type], (255, 255, 255))
             text_rect = text.get_rect(center=button_rect.center)
             screen.blit(text, text_rect)
         
-        instruction = self.small_font.render("Click event to trigger", True, (180, 180, 180))
-        screen.blit(instruction, (overlay_rect.x + 15, overlay_rect.bottom - 25))
 
     def save_state(self):
         state = {
@@ -934,33 +1284,42 @@ class UIController:
             'cells': []
         }
         
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                cell = self.game.get_cell(x, y)
-                if cell and cell.cell_type != CellType.EMPTY:
-                    state['cells'].append({
-                        'x': x, 'y': y,
-                        'type': cell.cell_type.value,
-                        'energy': cell.energy,
-                        'age': cell.age
-                    })
+        # collect live cells straight from the grid arrays instead of
+        # probing every coordinate through get_cell
+        ys, xs = np.nonzero(self.game.cell_type != CellType.EMPTY.value)
+        types = self.game.cell_type[ys, xs].tolist()
+        energies = self.game.energy[ys, xs].tolist()
+        ages = self.game.age[ys, xs].tolist()
+        state['cells'] = [
+            {'x': x, 'y': y, 'type': t, 'energy': e, 'age': a}
+            for x, y, t, e, a in zip(xs.tolist(), ys.tolist(), types, energies, ages)
+        ]
         
         filename = f"game_state_gen_{self.game.generation}.json"
         try:
             with open(filename, 'w') as f:
-                json.dump(state, f, indent=2)
+                json.dump(state, f, separators=(',', ':'))
             print(f"State saved to {filename}")
         except Exception as e:
             print(f"Error saving state: {e}")
 
     def load_state(self):
-        save_files = [f for f in os.listdir('.') if f.startswith('game_state_') and f.endswith('.json')]
-        if not save_files:
+        # scandir hands back cached stat info, so one directory pass
+        # replaces the listdir + per-file getmtime combination
+        latest_file = None
+        latest_mtime = None
+        with os.scandir('.') as entries:
+            for entry in entries:
+                if not (entry.name.startswith('game_state_') and entry.name.endswith('.json')):
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_file = entry.name
+                    latest_mtime = mtime
+        if latest_file is None:
             print("No save files found")
             return
         
-        latest_file = max(save_files, key=lambda f: os.path.getmtime(f))
-        
         try:
             with open(latest_file, 'r') as f:
                 state = json.load(f)
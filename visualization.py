@@ -5,6 +5,22 @@ import math
 from typing import Tuple, List, Optional
 from game_core import GameOfLife, CellType, Cell
 
+# shared particle sprites keyed by (r, g, b, alpha bucket); alpha is
+# quantized to 8 levels so a fading particle reuses a handful of surfaces
+_PARTICLE_SPRITES = {}
+
+
+def _particle_sprite(r: int, g: int, b: int, alpha_bucket: int) -> pygame.Surface:
+    key = (r, g, b, alpha_bucket)
+    sprite = _PARTICLE_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (r, g, b, alpha_bucket * 32 + 16), (2, 2), 2)
+        sprite = sprite.convert_alpha()
+        _PARTICLE_SPRITES[key] = sprite
+    return sprite
+
+
 class Visualizer:
     def __init__(self, game: GameOfLife, cell_size: int = 8):
         self.game = game
@@ -25,12 +41,29 @@ class Visualizer:
         self.particle_system = ParticleSystem()
         self.glow_surfaces = {}
         self.trail_surface = None
+
+        # cell-type -> RGB table for the batched frame blit
+        self._rgb_lut = np.array([self.colors[ct] for ct in CellType], dtype=np.uint8)
+        self._cell_surface = None
+        self._scaled_surface = None
+        self._grid_overlay = None
+        self._grid_overlay_key = None
+        self._fade_surface = None
+
+        # idle-frame reuse (see render)
+        self._cached_frame = None
+        self._last_generation = None
+        self._last_counts_obj = None
+        self._last_flags = None
+        self._trail_settle = 0
         self.show_energy = False
         self.show_age = False
         self.show_grid = False
         
         # Animation
         self.time = 0.0
+        self._quantum_lut_time = None
+        self._quantum_lut_arr = None
         
     def initialize_surfaces(self, screen):
         # Initialize glow surfaces for each cell type
@@ -43,20 +76,32 @@ class Visualizer:
         
         self.trail_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
 
+        self._cell_surface = pygame.Surface((self.game.width, self.game.height))
+        self._scaled_surface = pygame.Surface((self.screen_width, self.screen_height))
+
     def create_glow_surface(self, cell_type: CellType):
         if cell_type == CellType.EMPTY or cell_type not in self.glow_surfaces:
             return
         
         surface = self.glow_surfaces[cell_type]
-        center = (self.cell_size * 3 // 2, self.cell_size * 3 // 2)
+        center = self.cell_size * 3 // 2
         base_color = self.colors[cell_type]
-        
-        # Create radial gradient for glow effect
-        for radius in range(self.cell_size * 3 // 2, 0, -1):
-            alpha = int(255 * (1 - radius / (self.cell_size * 1.5)) ** 2)
-            if alpha > 0:
-                color = (*base_color, min(alpha, 100))
-                pygame.draw.circle(surface, color, center, radius)
+
+        # radial gradient computed in one shot: alpha falls off with the
+        # square of the distance from the center, capped at 100 like the
+        # old concentric-circle version
+        size = surface.get_width()
+        yy, xx = np.ogrid[:size, :size]
+        dist = np.hypot(xx - center, yy - center)
+        falloff = np.clip(1.0 - dist / (self.cell_size * 1.5), 0.0, None)
+        alpha = np.minimum(255 * falloff ** 2, 100).astype(np.uint8)
+
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[...] = base_color
+        del rgb
+        alpha_view = pygame.surfarray.pixels_alpha(surface)
+        alpha_view[...] = alpha
+        del alpha_view
 
     def get_cell_color(self, cell: Cell, x: int, y: int) -> Tuple[int, int, int]:
         if cell.cell_type == CellType.EMPTY:
@@ -115,81 +160,245 @@ class Visualizer:
     def draw_grid_lines(self, screen):
         if not self.show_grid:
             return
-        
+
+        # the grid only depends on screen size and cell size, so draw it
+        # once into a transparent overlay and blit that every frame
+        key = (self.screen_width, self.screen_height, self.cell_size)
+        if self._grid_overlay_key != key:
+            self._grid_overlay = self._build_grid_overlay()
+            self._grid_overlay_key = key
+
+        screen.blit(self._grid_overlay, (0, 0))
+
+    def _build_grid_overlay(self) -> pygame.Surface:
+        overlay = pygame.Surface((self.screen_width, self.screen_height),
+                                 pygame.SRCALPHA)
+
         grid_color = (40, 40, 50)
-        
+
         major_grid_color = (60, 60, 80)
-        
+
         for x in range(0, self.screen_width + 1, self.cell_size):
             cell_x = x // self.cell_size
             if cell_x % 10 == 0:
-                pygame.draw.line(screen, major_grid_color, (x, 0), (x, self.screen_height), 2)
+                pygame.draw.line(overlay, major_grid_color, (x, 0), (x, self.screen_height), 2)
             else:
-                pygame.draw.line(screen, grid_color, (x, 0), (x, self.screen_height), 1)
-        
+                pygame.draw.line(overlay, grid_color, (x, 0), (x, self.screen_height), 1)
+
         for y in range(0, self.screen_height + 1, self.cell_size):
             cell_y = y // self.cell_size
             if cell_y % 10 == 0:
-                pygame.draw.line(screen, major_grid_color, (0, y), (self.screen_width, y), 2)
+                pygame.draw.line(overlay, major_grid_color, (0, y), (self.screen_width, y), 2)
             else:
-                pygame.draw.line(screen, grid_color, (0, y), (self.screen_width, y), 1)
+                pygame.draw.line(overlay, grid_color, (0, y), (self.screen_width, y), 1)
+
+        return overlay.convert_alpha()
 
     def add_birth_effect(self, x: int, y: int, cell_type: CellType):
         pixel_x = x * self.cell_size + self.cell_size // 2
         pixel_y = y * self.cell_size + self.cell_size // 2
         color = self.colors[cell_type]
         
-        for _ in range(5):
-            self.particle_system.add_particle(
-                x=pixel_x, y=pixel_y,
-                vx=np.random.uniform(-2, 2),
-                vy=np.random.uniform(-2, 2),
-                color=color,
-                life=30
-            )
+        self.particle_system.add_particles(
+            pixel_x, pixel_y,
+            np.random.uniform(-2, 2, 5),
+            np.random.uniform(-2, 2, 5),
+            color, life=30
+        )
 
     def add_death_effect(self, x: int, y: int, cell_type: CellType):
         pixel_x = x * self.cell_size + self.cell_size // 2
         pixel_y = y * self.cell_size + self.cell_size // 2
         color = self.colors[cell_type]
         
-        for _ in range(8):
-            self.particle_system.add_particle(
-                x=pixel_x, y=pixel_y,
-                vx=np.random.uniform(-3, 3),
-                vy=np.random.uniform(-3, 3),
-                color=color,
-                life=20
-            )
+        self.particle_system.add_particles(
+            pixel_x, pixel_y,
+            np.random.uniform(-3, 3, 8),
+            np.random.uniform(-3, 3, 8),
+            color, life=20
+        )
 
     def render(self, screen) -> None:
+        # an idle frame (paused, no particles, no quantum animation and a
+        # fully faded trail) renders identically to the previous one, so
+        # reuse the cached copy instead of recomposing everything
+        counts_vec = self.game.get_population_counts_vec()
+        quantum_alive = int(counts_vec[CellType.QUANTUM.value]) > 0
+        if quantum_alive:
+            # the trail layer keeps fading for a while after the last
+            # quantum cell dies; 300 frames of alpha-5 decay is enough
+            # for the residue to vanish
+            self._trail_settle = 300
+        elif self._trail_settle > 0:
+            self._trail_settle -= 1
+
+        flags = (self.show_grid, self.show_energy, self.show_age)
+        if (self.game.generation == self._last_generation
+                and counts_vec is self._last_counts_obj
+                and flags == self._last_flags
+                and self.particle_system.particle_count == 0
+                and not quantum_alive
+                and self._trail_settle == 0
+                and self._cached_frame is not None
+                and self._cached_frame.get_size() == screen.get_size()):
+            screen.blit(self._cached_frame, (0, 0))
+            return
+
         self.time += 0.05
-        
+
         screen.fill((0, 0, 0))
         
-        fade_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        fade_surface.fill((0, 0, 0, 5))
-        self.trail_surface.blit(fade_surface, (0, 0))
-        
-        for y in range(self.game.height):
-            for x in range(self.game.width):
-                cell = self.game.grid[y, x]
-                self.draw_cell(screen, x, y, cell)
-                
-                if cell.cell_type == CellType.QUANTUM:
-                    trail_color = (*self.colors[CellType.QUANTUM], 30)
-                    pygame.draw.circle(self.trail_surface, trail_color,
-                                     (x * self.cell_size + self.cell_size // 2,
-                                      y * self.cell_size + self.cell_size // 2),
-                                     self.cell_size // 3)
+        if (self._fade_surface is None
+                or self._fade_surface.get_size() != (self.screen_width, self.screen_height)):
+            self._fade_surface = pygame.Surface(
+                (self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self._fade_surface.fill((0, 0, 0, 5))
+            self._fade_surface = self._fade_surface.convert_alpha()
+        self.trail_surface.blit(self._fade_surface, (0, 0))
         
+        self._render_batched(screen)
+
         screen.blit(self.trail_surface, (0, 0), special_flags=pygame.BLEND_ADD)
         
         self.particle_system.update()
         self.particle_system.draw(screen)
-        
+
         self.draw_grid_lines(screen)
 
+        self._last_generation = self.game.generation
+        self._last_counts_obj = counts_vec
+        self._last_flags = flags
+        if (self._cached_frame is None
+                or self._cached_frame.get_size() != screen.get_size()):
+            self._cached_frame = pygame.Surface(screen.get_size())
+        self._cached_frame.blit(screen, (0, 0))
+
+    def _draw_quantum_trail(self, x: int, y: int):
+        trail_color = (*self.colors[CellType.QUANTUM], 30)
+        pygame.draw.circle(self.trail_surface, trail_color,
+                         (x * self.cell_size + self.cell_size // 2,
+                          y * self.cell_size + self.cell_size // 2),
+                         self.cell_size // 3)
+
+    def _quantum_lut(self) -> np.ndarray:
+        # 256-entry phase -> RGB table, rebuilt when the animation time
+        # advances; replaces two colorsys conversions per quantum cell
+        if self._quantum_lut_time != self.time:
+            base = self.colors[CellType.QUANTUM]
+            h, s, v = colorsys.rgb_to_hsv(base[0] / 255, base[1] / 255, base[2] / 255)
+            phases = np.linspace(0.0, 2.0 * np.pi, 256, endpoint=False)
+            hues = (h + np.sin(phases + self.time) * 0.3) % 1.0
+
+            # vectorized hsv_to_rgb at constant saturation and value
+            sector = (hues * 6.0).astype(np.int64) % 6
+            frac = hues * 6.0 - np.floor(hues * 6.0)
+            p = np.full(256, v * (1.0 - s))
+            q = v * (1.0 - s * frac)
+            t = v * (1.0 - s * (1.0 - frac))
+            vv = np.full(256, v)
+            conds = [sector == k for k in range(6)]
+            r = np.select(conds, [vv, q, p, p, t, vv])
+            g = np.select(conds, [t, vv, vv, q, p, p])
+            b = np.select(conds, [p, p, t, vv, vv, q])
+            self._quantum_lut_arr = (np.stack([r, g, b], axis=1) * 255).astype(np.uint8)
+            self._quantum_lut_time = self.time
+        return self._quantum_lut_arr
+
+    def _compose_colors(self) -> np.ndarray:
+        # (H, W, 3) uint8 frame at one pixel per cell. Energy and age
+        # modifiers broadcast over the whole grid: empty cells have zero
+        # energy so the brightness factor keeps them black, and the age
+        # shift is masked to live cells
+        rgb = self._rgb_lut[self.game.cell_type]
+        if not self.show_energy and not self.show_age:
+            return rgb
+
+        rgb = rgb.astype(np.float32)
+        if self.show_energy:
+            factor = 0.3 + 0.7 * np.minimum(self.game.energy / 2.0, 1.0)
+            rgb *= factor[..., None]
+        if self.show_age:
+            age_factor = np.minimum(self.game.age / 50.0, 1.0).astype(np.float32) * 0.3
+            age_factor[self.game.cell_type == CellType.EMPTY.value] = 0.0
+            rgb += (255.0 - rgb) * age_factor[..., None]
+        return rgb.astype(np.uint8)
+
+    def _render_batched(self, screen):
+        # Compose the whole frame as an RGB array and move it in one
+        # blit_array + stretch blit; only quantum cells (phase coloring,
+        # glow, trails) and energy bars still need per-cell draws on top
+        if self._cell_surface.get_size() != (self.game.width, self.game.height):
+            self._cell_surface = pygame.Surface((self.game.width, self.game.height))
+        if self._scaled_surface.get_size() != (self.screen_width, self.screen_height):
+            self._scaled_surface = pygame.Surface((self.screen_width, self.screen_height))
+
+        pygame.surfarray.blit_array(self._cell_surface,
+                                    self._compose_colors().swapaxes(0, 1))
+        pygame.transform.scale(self._cell_surface,
+                               (self.screen_width, self.screen_height),
+                               self._scaled_surface)
+        screen.blit(self._scaled_surface, (0, 0))
+
+        cs = self.cell_size
+        quantum_y, quantum_x = np.nonzero(
+            self.game.cell_type == CellType.QUANTUM.value)
+        if quantum_y.size:
+            # Phase colors come from the per-frame LUT; hue rotation,
+            # brightness and age shift commute in HSV so the modifiers
+            # can be applied to the looked-up colors
+            lut = self._quantum_lut()
+            idx = (self.game.quantum_phase[quantum_y, quantum_x]
+                   * (256.0 / (2.0 * np.pi))).astype(np.int64) & 255
+            qcolors = lut[idx].astype(np.float32)
+            if self.show_energy:
+                factor = 0.3 + 0.7 * np.minimum(
+                    self.game.energy[quantum_y, quantum_x] / 2.0, 1.0)
+                qcolors *= factor[:, None]
+            if self.show_age:
+                age_factor = np.minimum(
+                    self.game.age[quantum_y, quantum_x] / 50.0, 1.0) * 0.3
+                qcolors += (255.0 - qcolors) * age_factor[:, None].astype(np.float32)
+            qcolors = qcolors.astype(np.uint8)
+
+            xs, ys = quantum_x.tolist(), quantum_y.tolist()
+            for i, (y, x) in enumerate(zip(ys, xs)):
+                pygame.draw.rect(screen, tuple(qcolors[i]),
+                                 (x * cs, y * cs, cs, cs))
+
+            glow_surface = self.glow_surfaces.get(CellType.QUANTUM)
+            if glow_surface:
+                # One batched blits() call instead of a pygame entry per glow
+                screen.blits([(glow_surface, (x * cs - cs, y * cs - cs),
+                               None, pygame.BLEND_ADD)
+                              for y, x in zip(ys, xs)], doreturn=0)
+
+            for y, x in zip(ys, xs):
+                self._draw_quantum_trail(x, y)
+
+        if self.show_energy:
+            alive = ((self.game.cell_type != CellType.EMPTY.value)
+                     & (self.game.cell_type != CellType.QUANTUM.value))
+
+            glow_y, glow_x = np.nonzero(alive & (self.game.energy > 1.5))
+            if glow_y.size:
+                glow_seq = []
+                for y, x in zip(glow_y.tolist(), glow_x.tolist()):
+                    glow_surface = self.glow_surfaces.get(CellType(self.game.cell_type[y, x]))
+                    if glow_surface:
+                        glow_seq.append((glow_surface, (x * cs - cs, y * cs - cs),
+                                         None, pygame.BLEND_ADD))
+                if glow_seq:
+                    screen.blits(glow_seq, doreturn=0)
+
+            bar_y, bar_x = np.nonzero(
+                (self.game.cell_type != CellType.EMPTY.value)
+                & (self.game.energy > 0))
+            for y, x in zip(bar_y.tolist(), bar_x.tolist()):
+                energy_height = int(cs * 0.8 * min(1.0, self.game.energy[y, x] / 2.0))
+                pygame.draw.rect(screen, (255, 255, 0),
+                                 (x * cs + cs - 2, y * cs + cs - energy_height,
+                                  2, energy_height))
+
     def world_to_grid(self, screen_x: int, screen_y: int) -> Tuple[int, int]:
         return screen_x // self.cell_size, screen_y // self.cell_size
 
@@ -203,58 +412,90 @@ class Visualizer:
         self.show_grid = not self.show_grid
 
 
-class Particle:
-    def __init__(self, x: float, y: float, vx: float, vy: float, 
-                 color: Tuple[int, int, int], life: int):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
+class ParticleSystem:
+    def __init__(self):
+        # Structure-of-arrays storage; per-particle math collapses to a
+        # handful of vector ops and dead particles compact via mask
+        self.x = np.empty(0, dtype=np.float32)
+        self.y = np.empty(0, dtype=np.float32)
+        self.vx = np.empty(0, dtype=np.float32)
+        self.vy = np.empty(0, dtype=np.float32)
+        self.life = np.empty(0, dtype=np.int32)
+        self.max_life = np.empty(0, dtype=np.int32)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+
+    def add_particle(self, x: float, y: float, vx: float, vy: float,
+                    color: Tuple[int, int, int], life: int):
+        self.x = np.append(self.x, np.float32(x))
+        self.y = np.append(self.y, np.float32(y))
+        self.vx = np.append(self.vx, np.float32(vx))
+        self.vy = np.append(self.vy, np.float32(vy))
+        self.life = np.append(self.life, np.int32(life))
+        self.max_life = np.append(self.max_life, np.int32(life))
+        self.color = np.concatenate([self.color,
+                                     np.array([color], dtype=np.uint8)])
+
+    def add_particles(self, x: float, y: float, vx: np.ndarray, vy: np.ndarray,
+                      color: Tuple[int, int, int], life: int):
+        n = len(vx)
+        self.x = np.concatenate([self.x, np.full(n, x, dtype=np.float32)])
+        self.y = np.concatenate([self.y, np.full(n, y, dtype=np.float32)])
+        self.vx = np.concatenate([self.vx, vx.astype(np.float32)])
+        self.vy = np.concatenate([self.vy, vy.astype(np.float32)])
+        self.life = np.concatenate([self.life, np.full(n, life, dtype=np.int32)])
+        self.max_life = np.concatenate([self.max_life,
+                                        np.full(n, life, dtype=np.int32)])
+        self.color = np.concatenate([self.color,
+                                     np.tile(np.array(color, dtype=np.uint8), (n, 1))])
+
+    @property
+    def particle_count(self) -> int:
+        return int(self.life.size)
 
     def update(self):
+        if self.life.size == 0:
+            return
+
         self.x += self.vx
         self.y += self.vy
         self.life -= 1
-        
+
         self.vy += 0.1
         self.vx *= 0.98
         self.vy *= 0.98
 
+        alive = self.life > 0
+        if not alive.all():
+            self.x = self.x[alive]
+            self.y = self.y[alive]
+            self.vx = self.vx[alive]
+            self.vy = self.vy[alive]
+            self.life = self.life[alive]
+            self.max_life = self.max_life[alive]
+            self.color = self.color[alive]
+
     def draw(self, screen):
-        if self.life <= 0:
+        n = self.life.size
+        if n == 0:
             return
-        
-        alpha = int(255 * (self.life / self.max_life))
-        color = (*self.color, alpha)
-        
-        particle_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surface, color, (2, 2), 2)
-        screen.blit(particle_surface, (int(self.x - 2), int(self.y - 2)))
-
-    def is_alive(self) -> bool:
-        return self.life > 0
-
 
-class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Particle] = []
-
-    def add_particle(self, x: float, y: float, vx: float, vy: float,
-                    color: Tuple[int, int, int], life: int):
-        self.particles.append(Particle(x, y, vx, vy, color, life))
-
-    def update(self):
-        for particle in self.particles[:]:
-            particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
-
-    def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+        buckets = np.clip(255 * self.life // self.max_life, 0, 255) >> 5
+        buckets = buckets.tolist()
+        xs = (self.x - 2).astype(np.int32).tolist()
+        ys = (self.y - 2).astype(np.int32).tolist()
+        colors = self.color.tolist()
+        blit_seq = []
+        for i in range(n):
+            r, g, b = colors[i]
+            blit_seq.append((_particle_sprite(r, g, b, buckets[i]),
+                             (xs[i], ys[i])))
+        screen.blits(blit_seq, doreturn=0)
 
     def clear(self):
-        self.particles.clear()
\ No newline at end of file
+        self.x = np.empty(0, dtype=np.float32)
+        self.y = np.empty(0, dtype=np.float32)
+        self.vx = np.empty(0, dtype=np.float32)
+        self.vy = np.empty(0, dtype=np.float32)
+        self.life = np.empty(0, dtype=np.int32)
+        self.max_life = np.empty(0, dtype=np.int32)
+        self.color = np.empty((0, 3), dtype=np.uint8)
\ No newline at end of file